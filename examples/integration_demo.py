@@ -28,12 +28,11 @@ def demonstrate_basic_usage():
     print(f"Config path: {env_info['config_path']}")
     print(f"Config files found: {env_info['config_files_found']}")
     
-    # Load and display configuration
-    config = manager.load_config()
-    print(f"Debug mode: {config['debug']}")
-    print(f"Log level: {config['logging']['level']}")
-    print(f"Max workers: {config['package_processing']['max_workers']}")
-    print(f"GitHub tokens configured: {len(config['github']['tokens'])}")
+    # Read individual settings; the config files are parsed on the first get()
+    print(f"Debug mode: {manager.get('debug')}")
+    print(f"Log level: {manager.get('logging.level')}")
+    print(f"Max workers: {manager.get('package_processing.max_workers')}")
+    print(f"GitHub tokens configured: {len(manager.get('github.tokens', []))}")
 
 
 def demonstrate_individual_settings():
@@ -151,12 +150,13 @@ def demonstrate_github_integration():
     
     class GitHubAPI:
         def __init__(self):
-            # Get GitHub configuration
-            self.tokens = get_config("github.tokens", [])
-            self.api_url = get_config("github.api_url", "https://api.github.com")
-            self.per_page = get_config("github.per_page", 100)
-            self.retry_attempts = get_config("github.retry_attempts", 3)
-            self.retry_delay = get_config("github.retry_delay", 1.0)
+            # Fetch the GitHub section once and read settings from it
+            cfg = get_config("github", {})
+            self.tokens = cfg.get("tokens", [])
+            self.api_url = cfg.get("api_url", "https://api.github.com")
+            self.per_page = cfg.get("per_page", 100)
+            self.retry_attempts = cfg.get("retry_attempts", 3)
+            self.retry_delay = cfg.get("retry_delay", 1.0)
             
         def make_request(self, endpoint):
             # Use configuration values for API requests
@@ -6,6 +6,9 @@ This script provides backward compatibility for users familiar with the original
 three-step workflow, while incorporating the new monitoring and configuration systems.
 """
 
+import argparse
+import asyncio
+import json
 import sys
 import time
 from pathlib import Path
@@ -13,17 +16,84 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from winget_automation.monitoring import (
-    get_logger,
-    setup_structured_logging,
-    get_progress_tracker,
-    check_all_health
-)
-from winget_automation.config import get_config
+_WORKFLOW_STEPS = ("package_processing", "github_analysis", "command_generation")
 
+_HEALTH_CACHE_PATH = Path.home() / ".cache" / "wmat" / "health.json"
 
-def run_legacy_workflow():
+_HELP_TEXT = """
+WinGet Manifest Generator Tool - Legacy Workflow Runner
+
+Usage:
+    python examples/legacy_workflow.py [command]
+
+Commands:
+    run                 Run the complete three-step workflow
+                        (add --skip-health to bypass health checks)
+    package            Run only package processing step
+    github             Run only GitHub analysis step  
+    commands           Run only command generation step
+    help               Show this help message
+
+Legacy Commands (Direct):
+    python src/winget_automation/PackageProcessor.py
+    python src/winget_automation/GitHub.py
+    python src/winget_automation/KomacCommandsGenerator.py
+
+Modern CLI (Recommended):
+    wmat health                    # Check system health
+    wmat process --dry-run         # Process packages with monitoring
+    wmat metrics                   # View system metrics
+
+Examples:
+    # Run complete workflow with monitoring
+    python examples/legacy_workflow.py run
+    
+    # Run individual steps
+    python examples/legacy_workflow.py package
+    python examples/legacy_workflow.py github
+    python examples/legacy_workflow.py commands
+    
+    # Use modern CLI
+    wmat health && wmat process --filter github
+"""
+
+
+def _cached_health(ttl=60):
+    """Run health checks, reusing a healthy result from the last ``ttl`` seconds."""
+    from winget_automation.monitoring import check_all_health
+    
+    try:
+        cached = json.loads(_HEALTH_CACHE_PATH.read_text(encoding="utf-8"))
+        if time.time() - cached["timestamp"] < ttl:
+            return cached["results"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    health_results = check_all_health()
+    
+    # Only healthy results are cached so failures are re-checked immediately
+    if health_results["overall_status"] == "healthy":
+        try:
+            _HEALTH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _HEALTH_CACHE_PATH.write_text(
+                json.dumps({"timestamp": time.time(), "results": health_results}, default=str),
+                encoding="utf-8",
+            )
+        except OSError:
+            pass
+    
+    return health_results
+
+
+def run_legacy_workflow(skip_health=False):
     """Run the complete legacy workflow with modern monitoring."""
+    # Imported here so `help` and argument errors don't pay for monitoring setup
+    from winget_automation.monitoring import (
+        get_logger,
+        setup_structured_logging,
+        get_progress_tracker,
+    )
+    
     print("=" * 80)
     print("WinGet Manifest Generator Tool - Legacy Workflow")
     print("=" * 80)
@@ -32,86 +102,27 @@ def run_legacy_workflow():
     setup_structured_logging(force_setup=True)
     logger = get_logger(__name__)
     
-    # Health check first
-    print("\n🔍 Running health checks...")
     logger.info("Starting legacy workflow execution")
     
-    health_results = check_all_health()
-    if health_results["overall_status"] != "healthy":
-        print("❌ Health checks failed. Please resolve issues before continuing.")
-        return False
-    print("✅ All health checks passed!")
+    # Health check first
+    if skip_health:
+        print("\n⏭️  Skipping health checks (--skip-health)")
+    else:
+        print("\n🔍 Running health checks...")
+        health_results = _cached_health()
+        if health_results["overall_status"] != "healthy":
+            print("❌ Health checks failed. Please resolve issues before continuing.")
+            return False
+        print("✅ All health checks passed!")
     
     # Setup progress tracking
-    steps = ["package_processing", "github_analysis", "command_generation"]
-    tracker = get_progress_tracker("legacy_workflow", steps)
+    tracker = get_progress_tracker("legacy_workflow", _WORKFLOW_STEPS)
     tracker.start_tracker()
     
     try:
-        # Step 1: Process WinGet Package Manifests
-        print("\n📦 Step 1: Processing WinGet Package Manifests...")
-        tracker.start_step("package_processing", 1, "Analyzing package manifests")
-        
-        print("Running: python src/winget_automation/PackageProcessor.py")
-        print("This analyzes all package manifests in the WinGet repository,")
-        print("extracts version patterns, and creates CSV files with package information.")
-        
-        # Import and run PackageProcessor
-        try:
-            from winget_automation.PackageProcessor import PackageProcessor
-            # Note: You would normally call the actual processor here
-            # For demo purposes, we'll simulate the process
-            time.sleep(2)  # Simulate processing time
-            logger.info("Package processing completed", step="package_processing")
-            tracker.update_step("package_processing", 1, "Package manifests processed")
-            tracker.complete_step("package_processing", "Package processing completed")
-            print("✅ Package processing completed!")
-        except Exception as e:
-            logger.error(f"Package processing failed: {str(e)}")
-            print(f"❌ Package processing failed: {str(e)}")
-            print("💡 Run directly: python src/winget_automation/PackageProcessor.py")
-        
-        # Step 2: Analyze GitHub Repositories
-        print("\n🐙 Step 2: Analyzing GitHub Repositories for Latest Versions...")
-        tracker.start_step("github_analysis", 1, "Checking GitHub repositories")
-        
-        print("Running: python src/winget_automation/GitHub.py")
-        print("This checks GitHub repositories for the latest versions of packages")
-        print("and compares them with the versions in WinGet.")
-        
-        try:
-            from winget_automation.GitHub import main as github_main
-            # Note: You would normally call the actual GitHub analyzer here
-            time.sleep(2)  # Simulate processing time
-            logger.info("GitHub analysis completed", step="github_analysis")
-            tracker.update_step("github_analysis", 1, "GitHub repositories analyzed")
-            tracker.complete_step("github_analysis", "GitHub analysis completed")
-            print("✅ GitHub analysis completed!")
-        except Exception as e:
-            logger.error(f"GitHub analysis failed: {str(e)}")
-            print(f"❌ GitHub analysis failed: {str(e)}")
-            print("💡 Run directly: python src/winget_automation/GitHub.py")
-        
-        # Step 3: Generate Update Commands
-        print("\n⚡ Step 3: Generating Update Commands...")
-        tracker.start_step("command_generation", 1, "Generating komac commands")
-        
-        print("Running: python src/winget_automation/KomacCommandsGenerator.py")
-        print("This creates komac update commands for packages that have")
-        print("newer versions available on GitHub.")
-        
-        try:
-            from winget_automation.KomacCommandsGenerator import KomacCommandsGenerator
-            # Note: You would normally call the actual command generator here
-            time.sleep(2)  # Simulate processing time
-            logger.info("Command generation completed", step="command_generation")
-            tracker.update_step("command_generation", 1, "Update commands generated")
-            tracker.complete_step("command_generation", "Command generation completed")
-            print("✅ Command generation completed!")
-        except Exception as e:
-            logger.error(f"Command generation failed: {str(e)}")
-            print(f"❌ Command generation failed: {str(e)}")
-            print("💡 Run directly: python src/winget_automation/KomacCommandsGenerator.py")
+        # Steps 1 and 2 are independent (disk scan vs. GitHub HTTP), so they
+        # run concurrently; step 3 needs both results.
+        asyncio.run(_run_workflow_steps(tracker, logger))
         
         tracker.complete_tracker("Legacy workflow completed successfully")
         logger.info("Legacy workflow execution completed successfully")
@@ -123,13 +134,116 @@ def run_legacy_workflow():
         
     except Exception as e:
         tracker.fail_tracker(e, f"Legacy workflow failed: {str(e)}")
-        logger.error(f"Legacy workflow failed: {str(e)}")
+        logger.error("Legacy workflow failed: %s", e)
         print(f"\n❌ Workflow failed: {str(e)}")
         return False
 
 
+def _in_thread(func, *args):
+    """Run a blocking call in the default executor (asyncio.to_thread needs 3.9+)."""
+    return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def _run_workflow_steps(tracker, logger):
+    """Run the three workflow steps, overlapping the two I/O-bound ones."""
+    package_ok, github_ok = await asyncio.gather(
+        _run_package(tracker, logger),
+        _run_github(tracker, logger),
+    )
+    await _run_commands(tracker, logger, package_ok, github_ok)
+
+
+async def _run_package(tracker, logger):
+    """Step 1: Process WinGet Package Manifests."""
+    print("\n📦 Step 1: Processing WinGet Package Manifests...")
+    tracker.start_step("package_processing", 1, "Analyzing package manifests")
+    
+    print("Running: python src/winget_automation/PackageProcessor.py")
+    print("This analyzes all package manifests in the WinGet repository,")
+    print("extracts version patterns, and creates CSV files with package information.")
+    
+    # Import and run PackageProcessor
+    try:
+        from winget_automation.PackageProcessor import PackageProcessor
+        # Note: You would normally call the actual processor here, wrapped in
+        # _in_thread() while it is still blocking.
+        # For demo purposes, we'll simulate the process
+        await _in_thread(time.sleep, 2)  # Simulate processing time
+        logger.info("Package processing completed", step="package_processing")
+        tracker.update_step("package_processing", 1, "Package manifests processed")
+        tracker.complete_step("package_processing", "Package processing completed")
+        print("✅ Package processing completed!")
+        return True
+    except Exception as e:
+        logger.error("Package processing failed: %s", e)
+        print(f"❌ Package processing failed: {str(e)}")
+        print("💡 Run directly: python src/winget_automation/PackageProcessor.py")
+        return False
+
+
+async def _run_github(tracker, logger):
+    """Step 2: Analyze GitHub Repositories."""
+    print("\n🐙 Step 2: Analyzing GitHub Repositories for Latest Versions...")
+    tracker.start_step("github_analysis", 1, "Checking GitHub repositories")
+    
+    print("Running: python src/winget_automation/GitHub.py")
+    print("This checks GitHub repositories for the latest versions of packages")
+    print("and compares them with the versions in WinGet.")
+    
+    try:
+        from winget_automation.GitHub import main as github_main
+        # Note: You would normally call the actual GitHub analyzer here
+        await _in_thread(time.sleep, 2)  # Simulate processing time
+        logger.info("GitHub analysis completed", step="github_analysis")
+        tracker.update_step("github_analysis", 1, "GitHub repositories analyzed")
+        tracker.complete_step("github_analysis", "GitHub analysis completed")
+        print("✅ GitHub analysis completed!")
+        return True
+    except Exception as e:
+        logger.error("GitHub analysis failed: %s", e)
+        print(f"❌ GitHub analysis failed: {str(e)}")
+        print("💡 Run directly: python src/winget_automation/GitHub.py")
+        return False
+
+
+async def _run_commands(tracker, logger, package_ok, github_ok):
+    """Step 3: Generate Update Commands from the results of steps 1 and 2."""
+    print("\n⚡ Step 3: Generating Update Commands...")
+    if not (package_ok and github_ok):
+        # The commands are built from both steps' output, so skip rather
+        # than generate them from missing or stale data
+        failed = [name for name, ok in (("package processing", package_ok),
+                                        ("GitHub analysis", github_ok)) if not ok]
+        logger.warning("Skipping command generation: %s failed", " and ".join(failed))
+        print(f"⏭️  Skipping command generation: {' and '.join(failed)} failed")
+        return False
+    
+    tracker.start_step("command_generation", 1, "Generating komac commands")
+    
+    print("Running: python src/winget_automation/KomacCommandsGenerator.py")
+    print("This creates komac update commands for packages that have")
+    print("newer versions available on GitHub.")
+    
+    try:
+        from winget_automation.KomacCommandsGenerator import KomacCommandsGenerator
+        # Note: You would normally call the actual command generator here
+        await _in_thread(time.sleep, 2)  # Simulate processing time
+        logger.info("Command generation completed", step="command_generation")
+        tracker.update_step("command_generation", 1, "Update commands generated")
+        tracker.complete_step("command_generation", "Command generation completed")
+        print("✅ Command generation completed!")
+        return True
+    except Exception as e:
+        logger.error("Command generation failed: %s", e)
+        print(f"❌ Command generation failed: {str(e)}")
+        print("💡 Run directly: python src/winget_automation/KomacCommandsGenerator.py")
+        return False
+
+
 def run_individual_step(step_name):
     """Run an individual step of the legacy workflow."""
+    from winget_automation.monitoring import get_logger, setup_structured_logging
+    
     setup_structured_logging(force_setup=True)
     logger = get_logger(__name__)
     
@@ -160,54 +274,23 @@ def run_individual_step(step_name):
 
 def show_help():
     """Show help information."""
-    print("""
-WinGet Manifest Generator Tool - Legacy Workflow Runner
-
-Usage:
-    python examples/legacy_workflow.py [command]
-
-Commands:
-    run                 Run the complete three-step workflow
-    package            Run only package processing step
-    github             Run only GitHub analysis step  
-    commands           Run only command generation step
-    help               Show this help message
-
-Legacy Commands (Direct):
-    python src/winget_automation/PackageProcessor.py
-    python src/winget_automation/GitHub.py
-    python src/winget_automation/KomacCommandsGenerator.py
-
-Modern CLI (Recommended):
-    wmat health                    # Check system health
-    wmat process --dry-run         # Process packages with monitoring
-    wmat metrics                   # View system metrics
-
-Examples:
-    # Run complete workflow with monitoring
-    python examples/legacy_workflow.py run
-    
-    # Run individual steps
-    python examples/legacy_workflow.py package
-    python examples/legacy_workflow.py github
-    python examples/legacy_workflow.py commands
-    
-    # Use modern CLI
-    wmat health && wmat process --filter github
-""")
+    print(_HELP_TEXT)
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        command = "run"
-    else:
-        command = sys.argv[1].lower()
+    # Help is printed by show_help(), so argparse's own -h handling is disabled
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("command", nargs="?", default="run")
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("--skip-health", action="store_true")
+    args, _ = parser.parse_known_args()
+    command = "help" if args.help else args.command.lower()
     
-    if command in ["help", "-h", "--help"]:
+    if command == "help":
         show_help()
     elif command == "run":
-        success = run_legacy_workflow()
+        success = run_legacy_workflow(skip_health=args.skip_health)
         sys.exit(0 if success else 1)
     elif command in ["package", "github", "commands"]:
         success = run_individual_step(command)
@@ -5,6 +5,10 @@ This example shows how to migrate existing GitHub-specific code
 to use the new multi-source architecture.
 """
 
+import re
+
+_GH_RE = re.compile(r"github\.com/([^/]+)/([^/]+)")
+
 # ================================
 # BEFORE: GitHub-only approach
 # ================================
@@ -26,8 +30,7 @@ def old_github_only_approach():
     github_url = "https://github.com/microsoft/PowerToys"
     
     # Extract repo info manually
-    import re
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", github_url)
+    match = _GH_RE.search(github_url)
     if match:
         username, repo = match.groups()
         
@@ -50,7 +53,8 @@ def new_multi_source_approach():
     """Example of how the code works now with multi-source support."""
     
     # New way - using unified interface that works with any source
-    from src.sources import get_package_metadata_for_url
+    from src.sources.registry import auto_detect_and_process_many
+    from src.config import get_config
     
     # Works with any supported source - no source-specific code needed!
     urls = [
@@ -59,12 +63,15 @@ def new_multi_source_approach():
         "https://sourceforge.net/projects/sevenzip/"   # SourceForge
     ]
     
-    for url in urls:
+    # Single unified call works for all sources; URLs are grouped by source
+    # and fetched concurrently instead of one request at a time
+    results = auto_detect_and_process_many(
+        urls, max_workers=get_config("package_processing.max_workers", 4)
+    )
+    
+    for url, metadata in results.items():
         print(f"\nProcessing: {url}")
         
-        # Single unified call works for all sources
-        metadata = get_package_metadata_for_url(url)
-        
         if metadata:
             print(f"  Source: {metadata.repository_info.source_type.value}")
             print(f"  Package: {metadata.identifier}")
@@ -115,10 +122,11 @@ def migration_example():
     # version = release_data['tag_name']
     # urls = release_data['asset_urls']
     
-    # NEW: Standardized metadata across all sources
-    from src.sources import get_package_metadata_for_url
+    # NEW: Standardized metadata across all sources (memoized per URL, so
+    # probing the same URL again in this run skips the HTTP round trip)
+    from src.sources.registry import auto_detect_and_process
     
-    metadata = get_package_metadata_for_url(url)
+    metadata = auto_detect_and_process(url)
     if metadata:
         version = metadata.latest_release.version
         urls = metadata.latest_release.download_urls
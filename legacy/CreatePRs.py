@@ -2,9 +2,28 @@ import os
 import re
 import requests
 import polars as pl
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+_NUMDOT = re.compile(r'[0-9.]+')
+# Everything str.isalpha() rejects: non-word characters, digits, underscore
+_NON_ALPHA = re.compile(r'[\W\d_]+')
+# Vectorized form of the get_release_info tag check, applied to lowercased
+# tags: is_valid_version_tag ('v' followed by no letters, not 'v.') or
+# is_numeric_string
+VALID_TAG_PATTERN = r'^(?:v(?:(?:[^\w.]|[\d_])(?:\W|[\d_])*)?|[0-9.]+)$'
+
+# CSV columns whose names differ from the ReleaseInfo field they fill
+RELEASE_COLUMN_RENAMES = {"IsEarliestVerReleases": "is_earliest_ver_releases"}
 
 @dataclass
 class ReleaseInfo:
@@ -35,10 +54,15 @@ class FileModifier:
             string_to_add: String to append to each line
         """
         try:
-            with open(input_file, 'r') as f_in, open(output_file, 'w') as f_out:
-                for line in f_in:
-                    modified_line = f"{line.rstrip()}{string_to_add}\n"
-                    f_out.write(modified_line)
+            # One read and one write; the suffix doubles as the line separator
+            with open(input_file, 'r') as f_in:
+                lines = f_in.read().split('\n')
+            if lines[-1] == '':
+                lines.pop()
+            suffix = f"{string_to_add}\n"
+            with open(output_file, 'w') as f_out:
+                if lines:
+                    f_out.write(suffix.join([line.rstrip() for line in lines]) + suffix)
         except IOError as e:
             raise IOError(f"Error modifying file: {e}")
 
@@ -67,13 +91,12 @@ class StringValidator:
         if '.' in second_char:
             return False
             
-        filtered_string = ''.join(char for char in string if char.isalpha())
-        return filtered_string == 'v' and len(filtered_string) == 1
+        return _NON_ALPHA.sub('', string) == 'v'
 
     @staticmethod
     def is_numeric_string(string: str) -> bool:
         """Check if string contains only numbers and dots."""
-        return bool(re.fullmatch(r'[0-9.]+', string))
+        return bool(_NUMDOT.fullmatch(string))
 
     @staticmethod
     def contains_substrings(value: str, string1: str, string2: str) -> bool:
@@ -83,11 +106,34 @@ class StringValidator:
 class GitHubReleaseProcessor:
     """Processes GitHub releases and generates komac commands."""
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, cache_path: Optional[str] = "data/gh_cache",
+                 cache_expire_after: int = 3600):
         self.headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        # One session for all lookups so connections are kept alive and reused
+        if requests_cache is not None and cache_path:
+            # Release tags rarely change: reuse responses across runs and
+            # duplicate (repo, tag) rows, revalidating with GitHub's ETag
+            self.session = requests_cache.CachedSession(
+                cache_path,
+                backend="sqlite",
+                expire_after=cache_expire_after,
+                allowable_codes=(200, 404),
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
+        # Pool sized above the 16 fetch threads in main() so every thread
+        # keeps its own alive connection; transient 5xx responses are retried
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
         
     def get_release_info(self, release: ReleaseInfo) -> Optional[List[str]]:
         """
@@ -110,7 +156,7 @@ class GitHubReleaseProcessor:
         url = f"https://api.github.com/repos/{release.username}/{release.reponame}/releases/tags/{release_tag}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response.raise_for_status()
             
             data = response.json()
@@ -136,51 +182,85 @@ def main():
     # Read and process data
     try:
         df_issues = pl.read_csv(data_dir / "OpenPRs.csv")
-        df = pl.read_csv(data_dir / "GitHub_Releasess.csv")
         
-        # Filter releases
-        df_new = df.filter(
-            (pl.col('update_requires') == 'Yes') & 
-            (pl.col('extension') != 'zip')
+        # Filter releases lazily so the filter runs inside the CSV scan
+        df_new = (
+            pl.scan_csv(data_dir / "GitHub_Releasess.csv")
+            .filter(
+                (pl.col('update_requires') == 'Yes') & 
+                (pl.col('extension') != 'zip')
+            )
+            .collect()
         )
         df_new.write_csv(data_dir / "GitHub_Releasessss.csv")
         
+        # Derive komac versions and drop tags get_release_info would reject
+        # in one vectorized pass, so only fetchable rows reach the HTTP stage
+        lower_tag = pl.col('github_latest_vers').str.to_lowercase()
+        df_new = (
+            df_new
+            .with_columns(
+                lower_tag.str.replace_all('v', '', literal=True).alias('komac_version'),
+                lower_tag.str.contains(VALID_TAG_PATTERN).alias('is_valid')
+            )
+            .filter(pl.col('is_valid'))
+        )
+        
+        # Open PR titles, plus one joined copy for a quick C-level
+        # containment check before scanning titles one by one
+        titles = df_issues['Title'].drop_nulls().to_list()
+        titles_blob = "\n".join(titles)
+        
         # Process releases
         processor = GitHubReleaseProcessor(token)
-        commands = []
         
-        for row in df_new.rows():
-            # Create ReleaseInfo object with all columns
-            release = ReleaseInfo(*row)
-            download_urls = processor.get_release_info(release)
-            
-            if not download_urls:
-                continue
-                
-            # Filter URLs by extension
-            proper_urls = [url for url in download_urls if f".{release.extension}" in url]
-            if len(proper_urls) != 1:
-                continue
-                
-            # Process version information
-            komac_version = release.github_latest_vers.lower().replace('v', '')
-            
-            # Check if already processed
-            if any(StringValidator.contains_substrings(value, release.pkgs_name, komac_version) 
-                   for value in df_issues['Title']):
-                continue
-                
-            # Generate command
-            command = (f"komac update {release.pkgs_name} --version {komac_version} "
-                      f"--urls {proper_urls[0]} --submit --token")
-            commands.append(command)
+        # Create ReleaseInfo objects with all columns and fetch their
+        # release assets concurrently, once per distinct (repo, tag) so
+        # packages sharing a release do not race each other for it
+        # Rows are bound to ReleaseInfo by column name, not position
+        release_fields = [field.name for field in fields(ReleaseInfo)]
+        releases = [
+            ReleaseInfo(**row)
+            for row in df_new.rename(RELEASE_COLUMN_RENAMES).select(release_fields).iter_rows(named=True)
+        ]
+        komac_versions = df_new['komac_version'].to_list()
+        unique_releases = {
+            (release.username, release.reponame, release.github_latest_vers): release
+            for release in releases
+        }
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            fetched = dict(zip(unique_releases,
+                               executor.map(processor.get_release_info, unique_releases.values())))
         
-        # Write commands to file
+        # Stream commands to file through a 1 MiB buffer instead of
+        # collecting them and joining one large string at the end
         output_file = "komac_commands.sh"
-        with open(output_file, "w") as file:
-            file.write("\n".join(commands))
+        command_count = 0
+        with open(output_file, "wb", buffering=1 << 20) as file:
+            for release, komac_version in zip(releases, komac_versions):
+                download_urls = fetched[(release.username, release.reponame, release.github_latest_vers)]
+                if not download_urls:
+                    continue
+                    
+                # Filter URLs by extension
+                proper_urls = [url for url in download_urls if f".{release.extension}" in url]
+                if len(proper_urls) != 1:
+                    continue
+                    
+                # Check if already processed; both parts must appear in the same
+                # title, which is only possible if both appear in the blob
+                if (release.pkgs_name in titles_blob and komac_version in titles_blob and
+                        any(StringValidator.contains_substrings(value, release.pkgs_name, komac_version)
+                            for value in titles)):
+                    continue
+                    
+                # Generate command
+                command = (f"komac update {release.pkgs_name} --version {komac_version} "
+                           f"--urls {proper_urls[0]} --submit --token\n")
+                file.write(command.encode())
+                command_count += 1
             
-        print(f"Successfully generated {len(commands)} commands in {output_file}")
+        print(f"Successfully generated {command_count} commands in {output_file}")
         
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -4,20 +4,62 @@ import json
 import re
 import polars as pl
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet, Union
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, lru_cache
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+_SPLIT_DIGITS = re.compile(r'([0-9]+)')
+_DOT_NUM = re.compile(r'^[\d.]+$')
+# username, repo and the last path segment (the installer file name)
+_GH_INSTALLER = re.compile(r"https://github\.com/([^/]+)/([^/]+)/(?:.*/)?([^/]*)$")
+_DASH_INSERT = re.compile(r'(\d+(?:\.\d+)*)-')
+_DASH_REDUCE = re.compile(r'(\d+)(?:\.\d+)*(-)')
+
+ALLOWED_EXTENSIONS = frozenset({"msixbundle", "appxbundle", "msix", "appx", "zip", "msi", "exe"})
+
+@lru_cache(maxsize=4096)
+def _version_key(version: str) -> Tuple[Any, ...]:
+    # Module-level so worker processes share one cache per process; version
+    # names like "1.0.0" repeat across many packages
+    parts = version.split('.')
+    if all(part.isdigit() for part in parts):
+        # Fast path for release-only tags like "1.2.3"; builds the same
+        # alternating str/int key as the regex split below
+        key: List[Any] = ['']
+        for part in parts:
+            key.append(int(part))
+            key.append('.')
+        key[-1] = ''
+        return tuple(key)
+    return tuple(int(x) if x.isdigit() else x for x in _SPLIT_DIGITS.split(version))
 
 @dataclass
 class Config:
     base_directory: Path = Path("winget-pkgs/manifests/")
     output_urls: Path = Path("data/urls.txt")
     output_data: Path = Path("data/GitHub_Release.csv")
-    allowed_extensions: List[str] = None
+    max_workers: Optional[int] = None  # defaults to the CPU count
+    allowed_extensions: Optional[FrozenSet[str]] = None
 
     def __post_init__(self):
-        self.allowed_extensions = ["msixbundle", "appxbundle", "msix", "appx", "zip", "msi", "exe"]
+        # Always a frozenset: process_installer tests membership per installer
+        if self.allowed_extensions is None:
+            self.allowed_extensions = ALLOWED_EXTENSIONS
+        else:
+            self.allowed_extensions = frozenset(self.allowed_extensions)
 
 class GitHubReleaseProcessor:
     def __init__(self, config: Config):
@@ -31,132 +73,156 @@ class GitHubReleaseProcessor:
             ("pkg_pattern", str),
             ("version_pattern_match", str)
         ]
-        self.df = pl.DataFrame([], schema=self.schema)
-        self.installer_urls: List[str] = []
+        # One list per collected column (everything except the derived
+        # version_pattern_match), filled in step and built into a frame once
+        self.columns: Dict[str, List[str]] = {name: [] for name, _ in self.schema[:-1]}
+        # Insertion-ordered set of installer URLs
+        self.installer_urls: Dict[str, None] = {}
 
     @staticmethod
-    def version_key(version: str) -> List[Any]:
-        return [int(x) if x.isdigit() else x for x in re.split(r'([0-9]+)', version)]
+    def version_pattern_expr() -> pl.Expr:
+        """Classify how latest_ver appears in the installer file name.
+
+        Evaluated once over the collected frame so the string checks run
+        column-wise in Polars instead of per installer in Python.
+        """
+        version = pl.col("latest_ver")
+        url_ext = pl.col("pkg_pattern")
+        in_url = url_ext.str.contains(version, literal=True)
+        has_dash = version.str.contains("-", literal=True)
+        dot_diff = (url_ext.str.count_matches(".", literal=True).cast(pl.Int32) - 1
+                    - version.str.count_matches(".", literal=True).cast(pl.Int32))
+        dot_zero_increase = version.str.replace_all(_DASH_INSERT.pattern, "${1}.0-")
+        dot_zero_reduce = version.str.replace_all(_DASH_REDUCE.pattern, "${1}.0${2}")
+
+        return (
+            pl.when(in_url & version.str.contains(_DOT_NUM.pattern))
+            .then(pl.lit("PatternMatchOnlyNum"))
+            .when(in_url & version.str.contains(r'^[vr][\d.]+$'))
+            .then(pl.concat_str([pl.lit("PatternMatchStartWith"), version.str.slice(0, 1)]))
+            .when(in_url)
+            .then(pl.lit("PatternMatchExact"))
+            .when((dot_diff > 0) & has_dash & url_ext.str.contains(dot_zero_increase, literal=True))
+            .then(pl.lit("DiffMatchDotZeroIncrease"))
+            .when((dot_diff < 0) & has_dash & url_ext.str.contains(dot_zero_reduce, literal=True))
+            .then(pl.lit("DiffMatchDotZeroReduce"))
+            .otherwise(pl.lit("different"))
+            .alias("version_pattern_match")
+        )
 
     @staticmethod
-    def is_dot_number_string(text: str) -> bool:
-        return bool(re.match(r'^[\d.]+$', text))
-
-    def determine_version_pattern(self, first_element: str, url_ext: str) -> str:
-        if first_element in url_ext:
-            if self.is_dot_number_string(first_element):
-                return "PatternMatchOnlyNum"
-            if first_element.startswith(("v", "r")) and self.is_dot_number_string(first_element[1:]):
-                return f"PatternMatchStartWith{first_element[0]}"
-            return "PatternMatchExact"
-
-        if url_ext.count('.') - 1 > first_element.count('.'):
-            if "-" in first_element:
-                string1 = re.sub(r'(\d+(?:\.\d+)*)-', r'\1.0-', first_element)
-                if string1 in url_ext:
-                    return "DiffMatchDotZeroIncrease"
-        elif url_ext.count('.') - 1 < first_element.count('.'):
-            if "-" in first_element:
-                pattern = r'(\d+)(?:\.\d+)*(-)'
-                string1 = re.sub(pattern, 
-                               lambda x: x.group(1) + ".0" + x.group(2) if "." not in x.group(1) else x.group(0), 
-                               first_element)
-                if string1 in url_ext:
-                    return "DiffMatchDotZeroReduce"
-        return "different"
-
-    def process_installer(self, installer: Dict[str, Any], first_element: str) -> Optional[Dict[str, Any]]:
-        if 'InstallerUrl' not in installer or 'https://github.com' not in installer['InstallerUrl']:
+    def process_installer(installer: Dict[str, Any], allowed_extensions: FrozenSet[str]) -> Optional[Dict[str, Any]]:
+        url = installer.get('InstallerUrl')
+        if not url:
             return None
 
-        url = installer['InstallerUrl']
-        parts = url.split("/")
-        url_ext = parts[-1]
-        extension = url_ext.split(".")[-1]
-
-        if extension not in self.config.allowed_extensions:
+        # One scan pulls out everything; non-GitHub URLs simply don't match
+        match = _GH_INSTALLER.search(url)
+        if not match:
             return None
 
-        match = re.search(r"https://github\.com/([^/]+)/([^/]+)/", url)
-        if not match:
+        username, repo_name, url_ext = match.groups()
+        extension = url_ext.rpartition(".")[2]
+        if extension not in allowed_extensions:
             return None
 
         return {
             'url': url,
-            'username': match.group(1),
-            'repo_name': match.group(2),
+            'username': username,
+            'repo_name': repo_name,
             'extension': extension,
-            'url_ext': url_ext,
-            'version_pattern': self.determine_version_pattern(first_element, url_ext)
+            'url_ext': url_ext
         }
 
-    def process_yaml_file(self, file_path: Path, dotrow: str, first_element: str) -> None:
+    @staticmethod
+    def process_yaml_file(file_path: Union[str, Path], dotrow: str, first_element: str,
+                          allowed_extensions: FrozenSet[str]) -> Optional[Tuple[str, Tuple[str, ...]]]:
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file) if file_path.suffix == '.json' else yaml.safe_load(file)
+            # Read bytes: libyaml and the JSON parsers decode UTF-8 themselves
+            with open(file_path, 'rb') as file:
+                data = _json_loads(file.read()) if os.fspath(file_path).endswith('.json') else yaml.load(file, Loader=SafeLoader)
 
             if 'Installers' not in data:
-                return
+                return None
 
-            installers = [self.process_installer(installer, first_element) 
+            installers = [GitHubReleaseProcessor.process_installer(installer, allowed_extensions)
                          for installer in data['Installers']]
             installers = [i for i in installers if i]
 
             if len(installers) == 1:
                 installer = installers[0]
-                self.installer_urls.append(installer['url'])
-                
-                df_row = pl.DataFrame({
-                    "username": installer['username'],
-                    "reponame": installer['repo_name'],
-                    "latest_ver": first_element,
-                    "extension": installer['extension'],
-                    "pkgs_name": dotrow[:-1],
-                    "pkg_pattern": installer['url_ext'],
-                    "version_pattern_match": installer['version_pattern']
-                })
-                self.df.extend(df_row)
-
+                # Values in self.columns order
+                return installer['url'], (
+                    installer['username'],
+                    installer['repo_name'],
+                    first_element,
+                    installer['extension'],
+                    dotrow[:-1],
+                    installer['url_ext']
+                )
+
+        except FileNotFoundError:
+            # No installer manifest for this version; opening directly saves
+            # a separate exists() stat on the common path
+            return None
         except Exception as e:
             print(f"Error processing {file_path}: {e}")
+        return None
 
-    def process_directory(self, row: List[str]) -> None:
+    @staticmethod
+    def process_directory(row: Tuple[Optional[str], ...], config: Config) -> Optional[Tuple[str, Tuple[str, ...]]]:
         row = [element for element in row if element]
-        slashrow = "/".join(row) + "/"
+        if not row:
+            return None
         dotrow = ".".join(row) + "."
-        directory_path = self.config.base_directory / f"{slashrow[0].lower()}" / slashrow
+        # Plain string joins: this runs once per package, and scandir/open
+        # take str paths directly without building Path objects
+        directory_path = os.path.join(config.base_directory, row[0][0].lower(), *row)
 
         try:
-            subdirectories = sorted(
-                [d for d in os.listdir(directory_path) if (directory_path / d).is_dir()],
-                key=self.version_key,
-                reverse=True
-            )
+            with os.scandir(directory_path) as entries:
+                subdirectories = [e.name for e in entries if e.is_dir(follow_symlinks=False)]
 
             if not subdirectories:
-                return
+                return None
 
-            first_element = subdirectories[0]
-            file_path = directory_path / first_element / f'{dotrow}installer.yaml'
-            
-            if file_path.exists():
-                self.process_yaml_file(file_path, dotrow, first_element)
+            # Only the newest version is used, so a linear max replaces the sort
+            first_element = max(subdirectories, key=_version_key)
+            file_path = os.path.join(directory_path, first_element, f'{dotrow}installer.yaml')
+            return GitHubReleaseProcessor.process_yaml_file(
+                file_path, dotrow, first_element, config.allowed_extensions)
 
         except Exception as e:
             print(f"Error processing directory {directory_path}: {e}")
+        return None
 
     def process_csv(self, csv_path: Path) -> None:
         df = pl.read_csv(csv_path)
-        rows = df.to_numpy().tolist()
-
-        with ThreadPoolExecutor() as executor:
-            executor.map(self.process_directory, rows)
+        # Row tuples straight from Polars, without a NumPy object-array copy
+        rows = df.iter_rows()
+
+        # Rows are independent and YAML parsing is CPU-bound, so they are
+        # spread over worker processes; process_directory is a staticmethod
+        # so only the config is pickled, and results are merged here
+        workers = self.config.max_workers or os.cpu_count() or 1
+        chunksize = max(1, df.height // (4 * workers))
+        columns = list(self.columns.values())
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(partial(self.process_directory, config=self.config),
+                                       rows, chunksize=chunksize):
+                if result:
+                    url, values = result
+                    self.installer_urls[url] = None
+                    for column, value in zip(columns, values):
+                        column.append(value)
 
     def save_results(self) -> None:
-        self.df.write_csv(self.config.output_data)
+        # Build the frame once from the column lists; the pattern column is
+        # derived afterwards from the collected columns
+        df = pl.DataFrame(self.columns, schema=self.schema[:-1])
+        df.with_columns(self.version_pattern_expr()).write_csv(self.config.output_data)
         
-        with open(self.config.output_urls, 'w') as file:
-            file.write('\n'.join(self.installer_urls))
+        self.config.output_urls.write_text('\n'.join(self.installer_urls) + '\n', encoding='utf-8')
 
 def main():
     config = Config()
@@ -1,10 +1,12 @@
 import subprocess
 import os
+import fnmatch
 import concurrent.futures
 import polars as pl
 import logging
+from functools import partial
 from pathlib import Path
-from typing import Set, List, Tuple, Optional
+from typing import Iterator, Set, List, Tuple, Optional
 from dataclasses import dataclass
 
 logging.basicConfig(
@@ -25,14 +27,13 @@ class YAMLProcessor:
         self.unique_rows: Set[Tuple[str, ...]] = set()
         self.max_dots = 0
 
-    def run_command(self, command: str, cwd: Optional[str] = None) -> int:
-        logging.info(f"Executing command: {command}")
+    def run_command(self, command: List[str], cwd: Optional[str] = None) -> int:
+        # e.g. run_command(["gh", "repo", "sync", "--source", repo], cwd=local_repo)
+        logging.info(f"Executing command: {' '.join(command)}")
         try:
-            result = subprocess.run(
+            subprocess.run(
                 command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                capture_output=True,
                 text=True,
                 cwd=cwd,
                 check=True
@@ -46,19 +47,37 @@ class YAMLProcessor:
             return 1
 
     def get_yaml_files(self) -> List[Path]:
-        return list(self.manifests_dir.rglob(self.config.file_pattern))
+        return [Path(path) for path in self._scan_yaml_files(str(self.manifests_dir))]
 
-    def process_yaml_file(self, file_path: Path) -> None:
-        name = file_path.stem.replace('.installer', '')
-        parts = name.split('.')
-        
-        if len(set(parts)) == 1:
+    def _scan_yaml_files(self, directory: str) -> Iterator[str]:
+        # DirEntry caches the file type from the directory read, so this
+        # avoids the extra stat per entry that rglob performs
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._scan_yaml_files(entry.path)
+                    elif fnmatch.fnmatch(entry.name, self.config.file_pattern):
+                        yield entry.path
+        except FileNotFoundError:
             return
+
+    @staticmethod
+    def process_yaml_file(file_path: Path, max_dots: int) -> Optional[Tuple[str, ...]]:
+        # Errors are caught per file so one bad file does not stop the others
+        try:
+            name = file_path.stem.replace('.installer', '')
+            parts = name.split('.')
             
-        # Ensure we have enough elements, pad with empty strings if needed
-        padded_parts = parts[:self.max_dots + 1] + [''] * (self.max_dots + 1 - len(parts))
-        row = tuple(padded_parts[:self.max_dots + 1])
-        self.unique_rows.add(row)
+            if len(set(parts)) == 1:
+                return None
+                
+            # Ensure we have enough elements, pad with empty strings if needed
+            padded_parts = parts[:max_dots + 1] + [''] * (max_dots + 1 - len(parts))
+            return tuple(padded_parts[:max_dots + 1])
+        except Exception as e:
+            logging.error(f"Error processing file {file_path}: {e}")
+            return None
 
     def calculate_max_dots(self, files: List[Path]) -> None:
         self.max_dots = max(
@@ -71,13 +90,7 @@ class YAMLProcessor:
             return pl.DataFrame()
 
         column_names = [f"column_{i}" for i in range(self.max_dots + 1)]
-        data_dict = {name: [] for name in column_names}
-        
-        for row in self.unique_rows:
-            for i, value in enumerate(row):
-                data_dict[column_names[i]].append(value)
-                
-        return pl.DataFrame(data_dict)
+        return pl.DataFrame(list(self.unique_rows), schema=column_names, orient="row")
 
     def write_csv(self) -> None:
         output_path = Path(self.config.output_file)
@@ -98,16 +111,15 @@ class YAMLProcessor:
 
         self.calculate_max_dots(yaml_files)
         
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = [
-                executor.submit(self.process_yaml_file, file_path)
-                for file_path in yaml_files
-            ]
-            concurrent.futures.wait(futures)
-            
-            for future in futures:
-                if future.exception():
-                    logging.error(f"Error processing file: {future.exception()}")
+        # Splitting file names is CPU-bound, so worker processes are used and
+        # rows are deduplicated here rather than in a shared set
+        # Per-file errors are handled in process_yaml_file; anything raised
+        # here (e.g. a broken pool) propagates rather than leaving a partial CSV
+        extract_row = partial(self.process_yaml_file, max_dots=self.max_dots)
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for row in executor.map(extract_row, yaml_files, chunksize=256):
+                if row is not None:
+                    self.unique_rows.add(row)
 
 def main():
     config = ProcessingConfig()
@@ -1,13 +1,42 @@
 import requests
 import polars as pl
 from pathlib import Path
-from typing import Optional, Tuple, List
-from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple, List, Dict
+from dataclasses import dataclass, field
 import os
+import json
+import asyncio
 import time
+import threading
+import atexit
+from itertools import cycle
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+def _trim_release(release: dict) -> dict:
+    # Release payloads carry assets, bodies and authors; keep what we read
+    return {"tag_name": release["tag_name"], "draft": release.get("draft"),
+            "prerelease": release.get("prerelease")}
+
 @dataclass
 class GitHubConfig:
     token: str
@@ -15,38 +44,168 @@ class GitHubConfig:
     per_page: int = 100
     retry_attempts: int = 3
     retry_backoff: float = 0.5
+    # Batched GraphQL lookups; repos the batch fails on fall back to REST
+    use_graphql: bool = True
+    graphql_batch_size: int = 50
+    use_async: bool = False
+    async_concurrency: int = 50
+    cache_path: Optional[str] = "data/gh_cache"
+    cache_expire_after: int = 3600
+    pool_maxsize: int = 20
+    etag_cache_path: Optional[str] = "data/gh_etags.json"
+    # Additional tokens; REST requests rotate over token + tokens
+    tokens: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.tokens = list(dict.fromkeys([self.token, *self.tokens]))
     
 class GitHubAPI:
     def __init__(self, config: GitHubConfig):
         self.config = config
-        self.session = self._create_session()
+        # One session (and connection pool) per token; REST calls take turns
+        # between them, skipping tokens GitHub reported as exhausted
+        self.sessions = [self._create_session(token) for token in config.tokens]
+        self.session = self.sessions[0]
+        self._session_cycle = cycle(range(len(self.sessions)))
+        self._exhausted_until: Dict[int, float] = {}
+        self._session_lock = threading.Lock()
+        # requests_cache already revalidates with ETags; without it, keep our
+        # own (etag, releases) sidecar so unchanged repos come back as 304s
+        self.etag_cache: Optional[Dict[str, dict]] = None
+        if requests_cache is None and config.etag_cache_path:
+            self.etag_cache = self._load_etag_cache()
         
-    def _create_session(self) -> requests.Session:
-        session = requests.Session()
+    def _create_session(self, token: str) -> requests.Session:
+        if requests_cache is not None and self.config.cache_path:
+            # Persist responses between runs; cache_control revalidates with
+            # the ETag GitHub sends, and 304s do not count against the rate limit
+            session = requests_cache.CachedSession(
+                self.config.cache_path,
+                backend="sqlite",
+                expire_after=self.config.cache_expire_after,
+                cache_control=True
+            )
+        else:
+            session = requests.Session()
         retry_strategy = Retry(
             total=self.config.retry_attempts,
             backoff_factor=self.config.retry_backoff,
-            status_forcelist=[429, 500, 502, 503, 504]
+            # Rate-limit responses (403/429) are handled in _request, which
+            # can switch tokens or wait for the quota to reset
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"]
+        )
+        # Keep at least one pooled connection per ReleaseChecker worker thread
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_maxsize,
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("https://", adapter)
         session.headers.update({
-            "Authorization": f"token {self.config.token}",
+            "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         })
         return session
 
-    def get_paginated_data(self, url: str, params: Optional[dict] = None) -> Optional[List[dict]]:
+    def close(self) -> None:
+        for session in self.sessions:
+            session.close()
+
+    def warm_up(self) -> None:
+        # Open each token's connection before the workers fan out, so the
+        # TLS handshake is not paid on the first lookups; /rate_limit is free
+        for session in self.sessions:
+            try:
+                session.get(f"{self.config.base_url}/rate_limit", timeout=10)
+            except requests.exceptions.RequestException:
+                pass
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        return self._request("GET", url, **kwargs)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        # A throttled request is retried on another token, or on the same one
+        # once GitHub says its quota has reset. Nothing waits up front, so
+        # requests the response cache can serve are never held back
+        for _ in range(len(self.sessions) + self.config.retry_attempts):
+            index = self._next_session_index()
+            response = self.sessions[index].request(method, url, **kwargs)
+            if self._record_rate_limit(index, response) is None:
+                return response
+            self._wait_for_token()
+        return response
+
+    def _next_session_index(self) -> int:
+        # Round-robin over tokens that have not been throttled; when all of
+        # them have, use the one that resets first
+        with self._session_lock:
+            now = time.time()
+            for _ in range(len(self.sessions)):
+                index = next(self._session_cycle)
+                if self._exhausted_until.get(index, 0) <= now:
+                    return index
+            return min(self._exhausted_until, key=self._exhausted_until.get)
+
+    def _wait_for_token(self) -> None:
+        # Called after a throttled response: sleep only if no token is left
+        with self._session_lock:
+            now = time.time()
+            if any(self._exhausted_until.get(index, 0) <= now
+                   for index in range(len(self.sessions))):
+                return
+            wait = max(min(self._exhausted_until.values()) - now, 1)
+        print(f"Rate limit reached. Waiting for {wait:.0f} seconds")
+        time.sleep(wait)
+
+    def _record_rate_limit(self, index: int, response: requests.Response) -> Optional[float]:
+        # Returns when to retry if the response was throttled, else None.
+        # Only a 403/429 marks the token exhausted; a 200 that reports
+        # Remaining: 0 (or a cached one) still succeeded
+        if response.status_code not in (403, 429):
+            return None
+        headers = response.headers
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None and retry_after.isdigit():
+            # Secondary rate limits say how long to back off instead
+            reset_at = time.time() + float(retry_after)
+        elif headers.get('X-RateLimit-Remaining') == '0':
+            # Without a reset time, check the token again in a minute
+            reset_at = float(headers.get('X-RateLimit-Reset') or time.time() + 60)
+        else:
+            # A 403 without rate-limit headers is a permission error
+            return None
+        with self._session_lock:
+            self._exhausted_until[index] = reset_at
+        return reset_at
+
+    def _load_etag_cache(self) -> Dict[str, dict]:
+        try:
+            with open(self.config.etag_cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_etag_cache(self) -> None:
+        if self.etag_cache is None:
+            return
+        path = Path(self.config.etag_cache_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.etag_cache, f)
+
+    def get_paginated_data(self, url: str, params: Optional[dict] = None,
+                           max_pages: Optional[int] = None,
+                           transform: Optional[Callable[[dict], Any]] = None) -> Optional[List]:
         all_data = []
-        while url:
-            response = self.session.get(url, params=params)
+        pages = 0
+        while url and (max_pages is None or pages < max_pages):
+            pages += 1
+            response = self._get(url, params=params)
             if response.status_code == 200:
-                all_data.extend(response.json())
+                page = _json_loads(response.content)
+                all_data.extend(map(transform, page) if transform else page)
                 url = response.links.get("next", {}).get("url")
-                if response.headers.get('X-RateLimit-Remaining', '1') == '0':
-                    reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                    sleep_time = max(reset_time - time.time(), 0)
-                    time.sleep(sleep_time)
             else:
                 print(f"Error {response.status_code}: {response.text}")
                 return None
@@ -55,24 +214,177 @@ class GitHubAPI:
 
     def get_latest_release(self, username: str, repo_name: str) -> Optional[str]:
         url = f"{self.config.base_url}/repos/{username}/{repo_name}/releases/latest"
-        response = self.session.get(url)
+        response = self._get(url)
         if response.status_code == 200:
             return response.json()["tag_name"]
         return None
 
-    def get_all_releases(self, username: str, repo_name: str) -> Optional[List[str]]:
+    def get_all_releases(self, username: str, repo_name: str, full: bool = False) -> Optional[List]:
+        # full=True returns the release dicts so callers can read draft/prerelease flags
         url = f"{self.config.base_url}/repos/{username}/{repo_name}/releases"
-        releases = self.get_paginated_data(url, {"per_page": self.config.per_page})
-        return [release["tag_name"] for release in releases] if releases else None
+        # Callers only look at the newest releases, which are all on the first page
+        params = {"per_page": self.config.per_page}
+        if self.etag_cache is not None:
+            releases = self._get_releases_conditional(f"{username}/{repo_name}", url, params)
+        else:
+            releases = self.get_paginated_data(url, params, max_pages=1, transform=_trim_release)
+        if not releases:
+            return None
+        return releases if full else [release["tag_name"] for release in releases]
+
+    def _get_releases_conditional(self, key: str, url: str, params: dict) -> Optional[List[dict]]:
+        # 304 Not Modified carries no body and does not count against the rate limit
+        cached = self.etag_cache.get(key)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        response = self._get(url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached["releases"]
+        if response.status_code != 200:
+            print(f"Error {response.status_code}: {response.text}")
+            return None
+
+        releases = [_trim_release(release) for release in _json_loads(response.content)]
+        etag = response.headers.get("ETag")
+        if etag:
+            self.etag_cache[key] = {"etag": etag, "releases": releases}
+        return releases
+
+    def get_releases_batch(self, repos: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[Optional[str], Optional[List[str]]]]:
+        # One GraphQL query covers a whole batch of repositories, returning the
+        # same (latest tag, release tags) pair the two REST endpoints provide
+        results = {}
+        repos = list(dict.fromkeys(repos))
+        batch_size = self.config.graphql_batch_size
+        for start in range(0, len(repos), batch_size):
+            batch = repos[start:start + batch_size]
+            params, fields, variables = [], [], {}
+            for i, (username, repo_name) in enumerate(batch):
+                params.append(f"$o{i}: String!, $n{i}: String!")
+                fields.append(
+                    f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ "
+                    f"latestRelease {{ tagName }} "
+                    f"releases(first: {self.config.per_page}, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+                    f"{{ nodes {{ tagName }} }} }}"
+                )
+                variables[f"o{i}"] = username
+                variables[f"n{i}"] = repo_name
+            query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+
+            try:
+                response = self._request("POST", f"{self.config.base_url}/graphql",
+                                         json={"query": query, "variables": variables})
+                if response.status_code != 200:
+                    print(f"Error {response.status_code}: {response.text}")
+                    continue
+                payload = _json_loads(response.content)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # The whole batch is looked up over REST instead
+                print(f"GraphQL request failed: {e}")
+                continue
+            data = payload.get("data") or {}
+            # A 200 can still carry errors (rate limits, resource limits, missing
+            # repos); leave those repos out so the caller looks them up over REST
+            failed = {error["path"][0] for error in payload.get("errors") or []
+                      if error.get("path")}
+            if payload.get("errors") and not data:
+                print(f"GraphQL errors: {payload['errors']}")
+                continue
+            for i, repo in enumerate(batch):
+                node = data.get(f"r{i}")
+                if not node or f"r{i}" in failed:
+                    continue
+                latest = (node.get("latestRelease") or {}).get("tagName")
+                tags = [release["tagName"] for release in node["releases"]["nodes"]]
+                results[repo] = (latest, tags or None)
+        return results
+
+def _tokens_from_env() -> Tuple[str, ...]:
+    # TOKEN and/or TOKEN_1, TOKEN_2, ... as read by the config manager
+    tokens = [os.environ["TOKEN"]] if os.environ.get("TOKEN") else []
+    i = 1
+    while os.environ.get(f"TOKEN_{i}"):
+        tokens.append(os.environ[f"TOKEN_{i}"])
+        i += 1
+    if not tokens:
+        raise RuntimeError("TOKEN environment variable not set")
+    return tuple(tokens)
+
+@lru_cache(maxsize=None)
+def get_github_api(*tokens: str) -> GitHubAPI:
+    # One GitHubAPI per token set, so repeated checkers share sessions and
+    # their pooled connections; the pools are drained at interpreter exit
+    github_api = GitHubAPI(GitHubConfig(token=tokens[0], tokens=list(tokens[1:])))
+    atexit.register(github_api.close)
+    return github_api
 
 class ReleaseChecker:
-    def __init__(self, github_api: GitHubAPI):
-        self.github_api = github_api
+    def __init__(self, github_api: Optional[GitHubAPI] = None, max_workers: int = 10):
+        self.github_api = github_api if github_api is not None else get_github_api(*_tokens_from_env())
+        self.max_workers = max_workers
 
     def check_versions(self, username: str, reponame: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-        latest_version = self.github_api.get_latest_release(username, reponame)
-        versions = self.github_api.get_all_releases(username, reponame)
-        
+        # /releases is newest first, so the latest release is its first entry
+        # that is neither a draft nor a prerelease; no /releases/latest call needed
+        releases = self.github_api.get_all_releases(username, reponame, full=True)
+        return self._summarize_releases(releases)
+
+    async def check_versions_async(self, repos: List[Tuple[str, str]]) -> List[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        # All lookups share one event loop and connection pool; the semaphore
+        # bounds how many are in flight at once
+        config = self.github_api.config
+        semaphore = asyncio.Semaphore(config.async_concurrency)
+        tokens = cycle(config.tokens)
+        timeout = aiohttp.ClientTimeout(total=30)
+        connector = aiohttp.TCPConnector(limit=config.async_concurrency)
+        headers = {"Accept": "application/vnd.github.v3+json"}
+
+        async def fetch(session, username: str, reponame: str):
+            url = f"{config.base_url}/repos/{username}/{reponame}/releases"
+            auth = {"Authorization": f"token {next(tokens)}"}
+            async with semaphore:
+                async with session.get(url, params={"per_page": config.per_page}, headers=auth) as response:
+                    if response.status != 200:
+                        print(f"Error {response.status}: {await response.text()}")
+                        return None
+                    return await response.json(loads=_json_loads)
+
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=headers) as session:
+            results = await asyncio.gather(
+                *(fetch(session, username, reponame) for username, reponame in repos),
+                return_exceptions=True
+            )
+
+        version_info = []
+        for (username, reponame), releases in zip(repos, results):
+            if isinstance(releases, Exception):
+                print(f"Error fetching releases for {username}/{reponame}: {releases}")
+                releases = None
+            version_info.append(self._summarize_releases(releases))
+        return version_info
+
+    def check_versions_batch(self, repos: List[Tuple[str, str]]) -> List[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        releases = self.github_api.get_releases_batch(repos)
+        # Repos missing from the result failed in GraphQL (whole batch or per repo)
+        return [
+            self._summarize_versions(*releases[repo]) if repo in releases
+            else self.check_versions(*repo)
+            for repo in repos
+        ]
+
+    @classmethod
+    def _summarize_releases(cls, releases: Optional[List[dict]]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        if not releases:
+            return cls._summarize_versions(None, None)
+        versions = [release["tag_name"] for release in releases]
+        latest_version = next(
+            (release["tag_name"] for release in releases
+             if not release.get("draft") and not release.get("prerelease")),
+            None
+        )
+        return cls._summarize_versions(latest_version, versions)
+
+    @staticmethod
+    def _summarize_versions(latest_version: Optional[str], versions: Optional[List[str]]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         early_lat_ver = None
         early_versions = None
         
@@ -83,60 +395,81 @@ class ReleaseChecker:
         return latest_version, early_lat_ver, early_versions
 
     def process_dataframe(self, input_path: Path, output_path: Path) -> None:
-        df = pl.read_csv(input_path)
-        df_filtered = df.filter(pl.col('version_pattern_match') == 'PatternMatchOnlyNum')
+        # Filter while scanning so rows that never need an API call are dropped early
+        lf = (
+            pl.scan_csv(input_path)
+            .filter(pl.col('version_pattern_match') == 'PatternMatchOnlyNum')
+        )
         
-        results = []
-        for row in df_filtered.rows():
-            username, reponame, winget_latest_ver = row[0], row[1], row[2]
-            github_latest_ver, ear_lat_version, early_versions = self.check_versions(username, reponame)
-            
-            update_require = self._determine_update_requirement(
-                winget_latest_ver, github_latest_ver, ear_lat_version
-            )
-            
-            results.append({
-                "github_latest_ver": github_latest_ver,
-                "update_require": update_require,
-                "ear_lat_version": ear_lat_version,
-                "early_versions": early_versions
-            })
+        # Only the first three columns (user, repo, WinGet version) are needed
+        # for the lookups, and each distinct triple only once
+        keys = lf.collect_schema().names()[:3]
+        df_lookup = lf.select(keys).unique(maintain_order=True).collect()
+        winget_vers = df_lookup.to_series(2).to_list()
+        # Several packages can come from one repository; look each repo up once
+        df_repos = df_lookup.select(pl.nth(0, 1)).unique(maintain_order=True)
+        usernames, reponames = (df_repos.to_series(i).to_list() for i in range(2))
+        repos = list(zip(usernames, reponames))
+        if self.github_api.config.use_async and aiohttp is not None:
+            repo_info = asyncio.run(self.check_versions_async(repos))
+        elif self.github_api.config.use_graphql:
+            repo_info = self.check_versions_batch(repos)
+        else:
+            # Lookups are network-bound, so run them concurrently; map keeps row order
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                repo_info = list(executor.map(self.check_versions, usernames, reponames))
+        info_by_repo = dict(zip(repos, repo_info))
+        version_info = [info_by_repo[repo] for repo in df_lookup.select(pl.nth(0, 1)).iter_rows()]
+
+        # Transpose the per-row results straight into columns
+        github_latest_vers, ear_lat_versions, early_versions = (
+            map(list, zip(*version_info)) if version_info else ([], [], [])
+        )
+        update_requires = [
+            self._determine_update_requirement(winget_ver, github_latest_ver, ear_lat_version)
+            for winget_ver, github_latest_ver, ear_lat_version in zip(winget_vers, github_latest_vers, ear_lat_versions)
+        ]
             
-        df_updated = df_filtered.with_columns([
-            pl.Series(name="update_requires", values=[r["update_require"] for r in results]),
-            pl.Series(name="github_latest_vers", values=[r["github_latest_ver"] for r in results]),
-            pl.Series(name="github_earliest_vers", values=[r["ear_lat_version"] for r in results]),
-            pl.Series(name="IsEarliestVerReleases", values=[r["early_versions"] for r in results])
-        ])
+        df_results = df_lookup.with_columns(
+            pl.Series(name="update_requires", values=update_requires, dtype=pl.String),
+            pl.Series(name="github_latest_vers", values=github_latest_vers, dtype=pl.String),
+            pl.Series(name="github_earliest_vers", values=ear_lat_versions, dtype=pl.String),
+            pl.Series(name="IsEarliestVerReleases", values=early_versions, dtype=pl.String)
+        )
         
-        df_updated.write_csv(output_path)
+        # Join the small result table back onto the scan by the lookup columns
+        # and stream the full rows to disk, so they are never held in memory
+        (
+            lf.join(df_results.lazy(), on=keys, how="left", maintain_order="left")
+            .sink_csv(output_path)
+        )
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _determine_update_requirement(winget_ver: str, github_latest: Optional[str], github_earliest: Optional[str]) -> str:
+        # Cached because packages from the same repo repeat the same triple
         if not github_earliest:
             return "NA"
             
-        if winget_ver.lower() in github_earliest.lower():
+        winget_low = winget_ver.lower()
+        if winget_low in github_earliest.lower():
             return "No"
             
-        if github_latest and winget_ver.lower() in github_latest.lower():
+        if github_latest and winget_low in github_latest.lower():
             return "No"
             
         return "Yes"
 
 def main():
-    token = os.environ.get("TOKEN")
-    if not token:
-        raise RuntimeError("TOKEN environment variable not set")
-        
-    config = GitHubConfig(token=token)
-    github_api = GitHubAPI(config)
-    checker = ReleaseChecker(github_api)
+    github_api = get_github_api(*_tokens_from_env())
+    checker = ReleaseChecker(github_api, max_workers=github_api.config.pool_maxsize)
+    github_api.warm_up()
     
     checker.process_dataframe(
         input_path=Path("data/GitHub_Release.csv"),
         output_path=Path("data/GitHub_Releasess.csv")
     )
+    github_api.save_etag_cache()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
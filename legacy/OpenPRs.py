@@ -1,44 +1,45 @@
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List
 import polars as pl
 from dataclasses import dataclass
 
 @dataclass
 class FieldConfig:
     names: List[str]
-    lengths: List[int]
 
     def __post_init__(self):
-        if len(self.names) != len(self.lengths):
-            raise ValueError("Number of field names must match field lengths")
-        if not all(length > 0 for length in self.lengths):
-            raise ValueError("Field lengths must be positive")
+        if not self.names:
+            raise ValueError("At least one field name is required")
 
 class TextToDataFrame:
     def __init__(self, field_config: FieldConfig):
         self.config = field_config
 
-    def process_line(self, line: str) -> Dict[str, str]:
-        try:
-            values = line.strip().split("\t")
-            if len(values) != len(self.config.names):
-                raise ValueError(f"Expected {len(self.config.names)} fields, got {len(values)}")
-            return {
-                name: value.ljust(length)
-                for name, length, value in zip(self.config.names, self.config.lengths, values)
-            }
-        except Exception as e:
-            raise ValueError(f"Error processing line: {line.strip()}\nError: {str(e)}")
-
     def convert(self, input_path: Path, output_path: Path) -> None:
         try:
+            # Split the tab-separated export natively instead of line by line;
+            # blank lines are skipped and every row must have all fields
             with open(input_path, "r", encoding="utf-8") as file:
-                data = [self.process_line(line) for line in file if line.strip()]
-            
-            if not data:
+                lines = pl.Series("line", file.read().splitlines(), dtype=pl.Utf8).str.strip_chars()
+            fields = lines.filter(lines != "").str.split("\t")
+
+            bad = fields.filter(fields.list.len() != len(self.config.names))
+            if len(bad):
+                values = bad[0].to_list()
+                line = "\t".join(values)
+                raise ValueError(
+                    f"Error processing line: {line}\n"
+                    f"Error: Expected {len(self.config.names)} fields, got {len(values)}"
+                )
+
+            df = pl.DataFrame({
+                name: fields.list.get(i).str.strip_chars()
+                for i, name in enumerate(self.config.names)
+            })
+
+            if df.is_empty():
                 raise ValueError("No data found in input file")
 
-            df = pl.DataFrame(data)
             df.write_csv(output_path)
             print(f"Successfully generated {output_path}")
 
@@ -47,8 +48,7 @@ class TextToDataFrame:
 
 def main():
     config = FieldConfig(
-        names=["ID", "Title", "Branch", "Status", "CreatedAt"],
-        lengths=[1000, 1500, 2000, 2000, 2000]
+        names=["ID", "Title", "Branch", "Status", "CreatedAt"]
     )
     
     converter = TextToDataFrame(config)
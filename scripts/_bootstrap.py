@@ -0,0 +1,15 @@
+"""Put the project's ``src`` directory on ``sys.path`` for the scripts here.
+
+Scripts import this module before any project import::
+
+    import _bootstrap  # noqa: F401
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
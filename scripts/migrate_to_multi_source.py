@@ -6,6 +6,7 @@ This script helps migrate from the old structure to the new multi-source archite
 
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -62,18 +63,33 @@ class MigrationHelper:
             "src/github/",
         ]
         
-        for file_path in legacy_files:
-            full_path = self.root_dir / file_path
-            if full_path.exists():
-                backup_path = self.backup_dir / file_path
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                if full_path.is_file():
-                    shutil.copy2(full_path, backup_path)
-                else:
-                    shutil.copytree(full_path, backup_path)
-                
-                logger.info(f"Backed up: {file_path}")
+        # Copying is I/O-bound: directory trees are walked here, but every
+        # file copy (including those inside copytree) runs on the pool
+        backed_up = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            copies = []
+            
+            def copy_file(src: str, dst: str) -> None:
+                copies.append(executor.submit(shutil.copy2, src, dst))
+            
+            for file_path in legacy_files:
+                full_path = self.root_dir / file_path
+                if full_path.exists():
+                    backup_path = self.backup_dir / file_path
+                    backup_path.parent.mkdir(parents=True, exist_ok=True)
+                    
+                    if full_path.is_file():
+                        copy_file(full_path, backup_path)
+                    else:
+                        shutil.copytree(full_path, backup_path, copy_function=copy_file)
+                    backed_up.append(file_path)
+            
+            # Surface the first copy error, as the serial copies did
+            for copy in copies:
+                copy.result()
+        
+        for file_path in backed_up:
+            logger.info(f"Backed up: {file_path}")
     
     def _migrate_github_files(self):
         """Migrate existing GitHub files to new structure."""
@@ -5,8 +5,6 @@ Legacy script for organizing removed rows by filter reason.
 NOTE: This functionality is now built directly into Filter.py!
 Use process_filters() with organize_removed=True instead.
 """
-import sys
-from pathlib import Path
 
 def main():
     """
@@ -3,13 +3,9 @@
 Script to organize removed rows by filter reason.
 This is now a wrapper around the Filter.py functionality.
 """
-import sys
 from pathlib import Path
 
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from winget_automation.github.Filter import organize_removed_rows_by_filter
+import _bootstrap  # noqa: F401
 
 def main():
     """
@@ -25,6 +21,9 @@ def main():
             print("Please run the filter process first to generate RemovedRows.csv")
             return
         
+        # Imported here so a missing input exits without loading polars
+        from winget_automation.github.Filter import organize_removed_rows_by_filter
+        
         print("🔄 Organizing removed rows by filter reason...")
         organize_removed_rows_by_filter(str(removed_rows_path), str(output_dir))
         print("✅ Organization completed!")
@@ -10,8 +10,12 @@ import argparse
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+# Directories that never hold our bytecode; not descended into when cleaning
+PYCACHE_SKIP_DIRS = frozenset({".git", "legacy_backup", "node_modules", ".venv", "venv"})
 
 
 class TestRunner:
@@ -27,6 +31,28 @@ class TestRunner:
         print(f"Running: {' '.join(command)}")
         return subprocess.run(command, check=check, cwd=self.project_root)
     
+    def run_parallel(self, commands: List[List[str]]) -> List[subprocess.CompletedProcess]:
+        """Run independent commands concurrently, returning results in order.
+        
+        Output is captured and printed per command once all have finished,
+        so the tools' reports do not interleave.
+        """
+        for command in commands:
+            print(f"Running: {' '.join(command)}")
+        
+        def run(command: List[str]) -> subprocess.CompletedProcess:
+            return subprocess.run(command, cwd=self.project_root,
+                                  capture_output=True, text=True)
+        
+        # Threads suffice: the work happens in the child processes
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            results = list(executor.map(run, commands))
+        
+        for result in results:
+            sys.stdout.write(result.stdout)
+            sys.stderr.write(result.stderr)
+        return results
+    
     def install_dependencies(self) -> None:
         """Install required dependencies."""
         print("Installing dependencies...")
@@ -102,12 +128,7 @@ class TestRunner:
         
         # Flake8
         try:
-            self.run_command([
-                sys.executable, "-m", "flake8", 
-                str(self.src_dir), str(self.test_dir),
-                "--max-line-length=88", 
-                "--extend-ignore=E203,W503"
-            ])
+            self.run_command(self._lint_command())
             print("✓ Flake8 checks passed")
         except subprocess.CalledProcessError:
             print("✗ Flake8 checks failed")
@@ -117,11 +138,7 @@ class TestRunner:
         print("Running type checking...")
         
         try:
-            self.run_command([
-                sys.executable, "-m", "mypy", 
-                str(self.src_dir),
-                "--ignore-missing-imports"
-            ])
+            self.run_command(self._type_check_command())
             print("✓ Type checking passed")
         except subprocess.CalledProcessError:
             print("✗ Type checking failed")
@@ -130,20 +147,53 @@ class TestRunner:
         """Format code with black."""
         print(f"{'Checking' if check_only else 'Formatting'} code style...")
         
+        try:
+            self.run_command(self._format_command(check_only))
+            print(f"✓ Code {'style check passed' if check_only else 'formatted successfully'}")
+        except subprocess.CalledProcessError:
+            print(f"✗ Code {'style check failed' if check_only else 'formatting failed'}")
+    
+    def run_static_checks(self) -> None:
+        """Run the style check, linting and type checking concurrently."""
+        print("Running static checks...")
+        
+        checks: List[Tuple[str, List[str]]] = [
+            ("Code style check", self._format_command(check_only=True)),
+            ("Flake8 checks", self._lint_command()),
+            ("Type checking", self._type_check_command()),
+        ]
+        results = self.run_parallel([command for _, command in checks])
+        
+        for (name, _), result in zip(checks, results):
+            if result.returncode == 0:
+                print(f"✓ {name} passed")
+            else:
+                print(f"✗ {name} failed")
+    
+    def _lint_command(self) -> List[str]:
+        return [
+            sys.executable, "-m", "flake8", 
+            str(self.src_dir), str(self.test_dir),
+            "--max-line-length=88", 
+            "--extend-ignore=E203,W503"
+        ]
+    
+    def _type_check_command(self) -> List[str]:
+        return [
+            sys.executable, "-m", "mypy", 
+            str(self.src_dir),
+            "--ignore-missing-imports"
+        ]
+    
+    def _format_command(self, check_only: bool) -> List[str]:
         command = [
             sys.executable, "-m", "black",
             str(self.src_dir), str(self.test_dir),
             "--line-length=88"
         ]
-        
         if check_only:
             command.append("--check")
-        
-        try:
-            self.run_command(command)
-            print(f"✓ Code {'style check passed' if check_only else 'formatted successfully'}")
-        except subprocess.CalledProcessError:
-            print(f"✗ Code {'style check failed' if check_only else 'formatting failed'}")
+        return command
     
     def run_security_checks(self) -> None:
         """Run security checks."""
@@ -198,10 +248,29 @@ class TestRunner:
                 print(f"  Removed {path}")
         
         # Remove __pycache__ directories
-        for pycache in self.project_root.rglob("__pycache__"):
+        for pycache in self._find_pycache_dirs(self.project_root):
             shutil.rmtree(pycache)
         
         print("✓ Cleanup completed")
+    
+    def _find_pycache_dirs(self, root: Path) -> List[str]:
+        """Collect __pycache__ directories with one scandir pass per directory."""
+        found = []
+        stack = [str(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name == "__pycache__":
+                        found.append(entry.path)
+                    elif entry.name not in PYCACHE_SKIP_DIRS:
+                        stack.append(entry.path)
+        return found
 
 
 def main():
@@ -296,9 +365,7 @@ def main():
         elif args.command == "all":
             print("Running complete test suite...")
             runner.install_dependencies()
-            runner.format_code(check_only=True)
-            runner.run_linting()
-            runner.run_type_checking()
+            runner.run_static_checks()
             runner.run_tests(
                 test_type="all",
                 verbose=not args.quiet,
@@ -3,13 +3,10 @@
 
 import os
 import sys
-from pathlib import Path
 
-# Add src to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from winget_automation.config import get_config_manager, get_config
-from winget_automation.config.manager import ConfigManager
 
 
 def test_config_loading():
@@ -18,7 +15,8 @@ def test_config_loading():
     
     # Test with development environment
     os.environ["WINGET_ENV"] = "development"
-    manager = ConfigManager()
+    manager = get_config_manager()
+    manager.set_environment()
     
     config = manager.load_config()
     print(f"✓ Loaded configuration for environment: {config.get('environment')}")
@@ -39,11 +37,12 @@ def test_environment_detection():
         "production": ["prod", "production", "PROD"]
     }
     
+    manager = get_config_manager()
     for expected, env_values in test_envs.items():
         for env_value in env_values:
             os.environ["WINGET_ENV"] = env_value
-            manager = ConfigManager()
-            detected = manager.environment
+            # Only re-detects the environment; no configuration is read
+            detected = manager.set_environment()
             if detected == expected:
                 print(f"✓ {env_value} -> {detected}")
             else:
@@ -57,7 +56,8 @@ def test_config_access():
     print("\nTesting configuration access...")
     
     os.environ["WINGET_ENV"] = "development"
-    manager = ConfigManager()
+    manager = get_config_manager()
+    manager.set_environment()
     config = manager.load_config()
     
     # Test get method with dot notation
@@ -86,8 +86,8 @@ def test_environment_variables():
     os.environ["MAX_WORKERS"] = "16"
     os.environ["DEBUG"] = "true"
     
-    manager = ConfigManager()
-    config = manager.load_config()
+    manager = get_config_manager()
+    config = manager.reload()
     
     # Check if environment variables are applied
     tokens = config.get("github", {}).get("tokens", [])
@@ -104,6 +104,7 @@ def test_environment_variables():
     for var in ["TOKEN_1", "TOKEN_2", "LOG_LEVEL", "MAX_WORKERS", "DEBUG"]:
         if var in os.environ:
             del os.environ[var]
+    manager.reload()
     
     return True
 
@@ -112,7 +113,7 @@ def test_config_validation():
     """Test configuration validation."""
     print("\nTesting configuration validation...")
     
-    manager = ConfigManager()
+    manager = get_config_manager()
     config = manager.load_config()
     
     # Validate the loaded configuration
@@ -140,7 +141,7 @@ def test_environment_info():
     """Test environment information."""
     print("\nTesting environment information...")
     
-    manager = ConfigManager()
+    manager = get_config_manager()
     env_info = manager.get_environment_info()
     
     print(f"✓ Environment: {env_info['environment']}")
@@ -3,11 +3,16 @@
 Quick test script to verify all legacy scripts work with fixed imports.
 """
 
+import contextlib
+import importlib.util
+import io
 import subprocess
 import sys
 import time
 from pathlib import Path
 
+from _bootstrap import PROJECT_ROOT
+
 
 def run_command_with_timeout(cmd, timeout=10, description=""):
     """Run a command with timeout and return success status."""
@@ -44,31 +49,52 @@ def run_command_with_timeout(cmd, timeout=10, description=""):
         return False
 
 
+def load_script(script_path):
+    """Execute a script as a module in this interpreter (its main guard does not run)."""
+    full_path = PROJECT_ROOT / script_path
+    spec = importlib.util.spec_from_file_location(f"_compat_{full_path.stem}", full_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def test_import_only(script_path, description=""):
     """Test if a script can be imported without errors."""
     print(f"\n📦 Testing imports: {description}")
     
+    # Imported in-process: no interpreter start-up per script, and modules
+    # shared between scripts are only imported once
     try:
-        # Test import
-        result = subprocess.run([
-            sys.executable, "-c", 
-            f"import sys; sys.path.insert(0, 'src'); "
-            f"from pathlib import Path; "
-            f"exec(open('{script_path}').read()); "
-            f"print('✅ Imports successful')"
-        ], capture_output=True, text=True, timeout=5,
-        cwd=Path(__file__).parent.parent)
-        
-        if result.returncode == 0 or "✅ Imports successful" in result.stdout:
-            print("✅ SUCCESS: All imports work correctly")
-            return True
-        else:
-            print(f"❌ FAILED: {result.stderr}")
+        load_script(script_path)
+        print("✅ SUCCESS: All imports work correctly")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {type(e).__name__}: {e}")
+        return False
+
+
+def run_main_in_process(script_path, argv, description=""):
+    """Run a script's main() in this interpreter with the given arguments."""
+    print(f"\n🔍 Testing: {description}")
+    print(f"Command: {script_path} {' '.join(argv)}")
+    
+    saved_argv = sys.argv
+    sys.argv = [str(script_path), *argv]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            load_script(script_path).main()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"❌ FAILED: exited with status {e.code}")
             return False
-            
     except Exception as e:
-        print(f"❌ ERROR: {str(e)}")
+        print(f"❌ FAILED: {type(e).__name__}: {e}")
         return False
+    finally:
+        sys.argv = saved_argv
+    
+    print("✅ SUCCESS: Script completed successfully")
+    return True
 
 
 def main():
@@ -102,9 +128,8 @@ def main():
     results.append(("KomacCommandsGenerator", success))
     
     # Test 4: Legacy workflow runner
-    success = run_command_with_timeout(
-        [sys.executable, "examples/legacy_workflow.py", "help"],
-        timeout=5,
+    success = run_main_in_process(
+        "examples/legacy_workflow.py", ["help"],
         description="Legacy workflow runner help"
     )
     results.append(("Legacy workflow help", success))
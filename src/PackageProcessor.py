@@ -12,8 +12,14 @@ import os
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlparse
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Handle both relative and absolute imports
 import sys
 from pathlib import Path
@@ -55,6 +61,14 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+_SPLIT_DIGITS = re.compile(r'([0-9]+)')
+
+
+@lru_cache(maxsize=4096)
+def _version_key(v: str) -> Tuple[Union[int, str], ...]:
+    """Natural sort key for version directory names (cached; names repeat a lot)."""
+    return tuple(int(p) if p.isdigit() else p for p in _SPLIT_DIGITS.split(v))
+
 
 @dataclass
 class ProcessingConfig(BaseConfig):
@@ -236,7 +250,7 @@ class PackageProcessor(YAMLProcessorBase):
         try:
             async with aiofiles.open(yaml_path, 'r', encoding='utf-8') as f:
                 content = await f.read()
-                result = yaml.safe_load(content)
+                result = yaml.load(content, Loader=_YamlLoader)
                 
                 # Cache the result for future use
                 if result and len(self._yaml_cache) < 1000:  # Limit cache size
@@ -456,13 +470,8 @@ class PackageProcessor(YAMLProcessorBase):
             self.package_versions[package_name] = set(version_dirs)
 
         # Find latest version efficiently
-        def version_key(v):
-            # Optimized version sorting
-            parts = re.split(r'([0-9]+)', v)
-            return [int(p) if p.isdigit() else p for p in parts]
-
         try:
-            latest_version = max(version_dirs, key=version_key)
+            latest_version = max(version_dirs, key=_version_key)
         except (ValueError, TypeError):
             # Fallback to string sorting if version parsing fails
             latest_version = max(version_dirs)
@@ -923,13 +932,8 @@ class PackageProcessor(YAMLProcessorBase):
             self.package_versions[package_name] = set(version_dirs)
 
             # Find latest version efficiently
-            def version_key(v):
-                # Optimized version sorting
-                parts = re.split(r'([0-9]+)', v)
-                return [int(p) if p.isdigit() else p for p in parts]
-
             try:
-                latest_version = max(version_dirs, key=version_key)
+                latest_version = max(version_dirs, key=_version_key)
             except (ValueError, TypeError):
                 # Fallback to string sorting if version parsing fails
                 latest_version = max(version_dirs)
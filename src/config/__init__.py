@@ -15,9 +15,10 @@ Usage:
     # Get the complete configuration
     config = get_config()
     
-    # Use the configuration manager directly
+    # Use the configuration manager directly; files are parsed lazily on
+    # the first get(), so load_config() is only needed to force a reload
     manager = get_config_manager()
-    config = manager.load_config()
+    config = manager.load_config(force_reload=True)
 """
 
 from .manager import ConfigManager, get_config_manager, get_config
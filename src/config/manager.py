@@ -1,11 +1,13 @@
 """Configuration management system for WinGet Manifest Generator Tool."""
 
 import os
+import re
+import copy as copy_module
 import json
 import yaml
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
 try:
@@ -13,6 +15,11 @@ try:
 except ImportError:
     load_dotenv = None
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 try:
     from .schema import ConfigSchema
     from ..exceptions import ConfigurationError
@@ -24,6 +31,59 @@ except ImportError:
     from exceptions import ConfigurationError
 
 
+# Sentinel for configuration keys that do not exist
+_MISSING = object()
+
+# Dotted keys split into path tuples; keys are fixed strings in code, so this
+# stays small and survives config reloads
+_key_paths: Dict[str, Tuple[str, ...]] = {}
+
+
+# Loaded configurations shared by all managers, keyed by everything that
+# feeds into them (see ConfigManager._config_cache_key)
+_CONFIG_CACHE: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy the dicts and lists of a configuration value, sharing the leaves.
+    
+    Parsed configuration only nests dicts and lists around immutable scalars,
+    so this gives the caller an independent value much faster than deepcopy.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
+# Environment variables read by ConfigManager._load_environment_variables,
+# besides TOKEN and TOKEN_<n>, mapped to the configuration path they set
+_ENV_VAR_PATHS: Dict[str, Tuple[str, ...]] = {
+    "WINGET_REPO_PATH": ("package_processing", "winget_repo_path"),
+    "OUTPUT_DIR": ("package_processing", "output_directory"),
+    "LOG_LEVEL": ("logging", "level"),
+    "LOG_FILE": ("logging", "file"),
+    "MAX_WORKERS": ("package_processing", "max_workers"),
+    "BATCH_SIZE": ("package_processing", "batch_size"),
+    "TIMEOUT": ("package_processing", "timeout"),
+    "CACHE_ENABLED": ("performance", "cache_enabled"),
+    "CACHE_TTL": ("performance", "cache_ttl"),
+    "DEBUG": ("debug",),
+}
+_CONFIG_ENV_VARS = frozenset(_ENV_VAR_PATHS)
+
+# Numbered GitHub token variables (TOKEN_1, TOKEN_2, ...)
+_TOKEN_ENV_RE = re.compile(r"^TOKEN_([1-9]\d*)$")
+
+
+def _key_path(key: str) -> Tuple[str, ...]:
+    """Return the path tuple for a dotted configuration key."""
+    path = _key_paths.get(key)
+    if path is None:
+        path = _key_paths[key] = tuple(key.split('.'))
+    return path
+
+
 @dataclass
 class EnvironmentConfig:
     """Environment-specific configuration settings."""
@@ -64,6 +124,9 @@ class ConfigManager:
         self.schema = ConfigSchema()
         self._config: Dict[str, Any] = {}
         self._loaded = False
+        # Resolved dotted-key lookups; cleared whenever the config changes
+        self._lookup_cache: Dict[str, Any] = {}
+        self._config_files_found: Optional[List[str]] = None
         
         # Environment-specific defaults
         self.env_configs = {
@@ -162,6 +225,17 @@ class ConfigManager:
         if self._loaded and not force_reload:
             return self._config
         
+        self._config_files_found = None
+        
+        # Another manager may already have loaded the same, unchanged files
+        # under the same environment; reuse its result unless forced
+        cache_key = self._config_cache_key()
+        if cache_key is not None and not force_reload and cache_key in _CONFIG_CACHE:
+            self._config = copy_module.deepcopy(_CONFIG_CACHE[cache_key])
+            self._loaded = True
+            self._lookup_cache.clear()
+            return self._config
+        
         try:
             # Load unified configuration file
             config = self._load_unified_config()
@@ -182,6 +256,10 @@ class ConfigManager:
             
             self._config = config
             self._loaded = True
+            self._lookup_cache.clear()
+            if cache_key is not None:
+                # Stored as a private copy since set() mutates self._config
+                _CONFIG_CACHE[cache_key] = copy_module.deepcopy(config)
             
             return self._config
         
@@ -190,6 +268,32 @@ class ConfigManager:
                 raise
             raise ConfigurationError(f"Failed to load configuration: {str(e)}")
     
+    def _config_cache_key(self) -> Optional[Tuple[Any, ...]]:
+        """Build the shared cache key for the current inputs of load_config.
+        
+        The key covers the config file's path, modification time and size,
+        the environment, and every environment variable load_config reads.
+        
+        Returns:
+            Cache key, or None if the config file cannot be stat'ed
+        """
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        
+        env_vars = tuple(sorted(
+            (name, value) for name, value in os.environ.items()
+            if name in _CONFIG_ENV_VARS or name.startswith("TOKEN")
+        ))
+        return (str(self.config_path), stat.st_mtime_ns, stat.st_size,
+                self.environment, env_vars)
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all configurations shared between manager instances."""
+        _CONFIG_CACHE.clear()
+    
     def _get_environment_defaults(self) -> Dict[str, Any]:
         """Get default configuration for the current environment."""
         env_config = self.env_configs.get(self.environment)
@@ -295,7 +399,7 @@ class ConfigManager:
                 if file_path.suffix.lower() == '.json':
                     return json.load(f)
                 else:  # Assume YAML
-                    return yaml.safe_load(f) or {}
+                    return yaml.load(f, Loader=_YamlLoader) or {}
         except Exception as e:
             raise ConfigurationError(f"Failed to load config file {file_path}: {str(e)}")
     
@@ -304,13 +408,22 @@ class ConfigManager:
         if not self.config_path.exists():
             raise ConfigurationError(f"Configuration file not found: {self.config_path}")
         
+        use_cache = os.getenv("WINGET_CONFIG_CACHE") == "1" and self.config_path.is_file()
+        if use_cache:
+            cached = self._read_config_cache()
+            if cached is not None:
+                return cached
+        
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             
             if not config:
                 raise ConfigurationError("Configuration file is empty")
             
+            if use_cache:
+                self._write_config_cache(config)
+            
             return config
         
         except yaml.YAMLError as e:
@@ -318,6 +431,52 @@ class ConfigManager:
         except Exception as e:
             raise ConfigurationError(f"Failed to read configuration file: {e}")
     
+    def _get_config_cache_path(self) -> Path:
+        """Get the JSON snapshot path for the current state of the config file.
+        
+        The name embeds the file's modification time and size, so editing the
+        YAML automatically selects a new snapshot.
+        """
+        stat = self.config_path.stat()
+        return self.config_path.with_name(
+            f"{self.config_path.stem}.{stat.st_mtime_ns:x}-{stat.st_size:x}.cache.json"
+        )
+    
+    def _read_config_cache(self) -> Optional[Dict[str, Any]]:
+        """Read the parsed configuration snapshot if it is still current.
+        
+        Returns:
+            Cached configuration dictionary, or None if no valid snapshot exists
+        """
+        try:
+            return json.loads(self._get_config_cache_path().read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_config_cache(self, config: Dict[str, Any]) -> None:
+        """Write a JSON snapshot of the parsed configuration.
+        
+        Snapshots for older versions of the file are removed. Configurations
+        that JSON cannot reproduce exactly (e.g. non-string keys) are not
+        snapshotted. Failures are logged and otherwise ignored since the cache
+        is only an optimization.
+        
+        Args:
+            config: Parsed configuration dictionary
+        """
+        try:
+            cache_path = self._get_config_cache_path()
+            for stale in self.config_path.parent.glob(f"{self.config_path.stem}.*.cache.json"):
+                if stale != cache_path:
+                    stale.unlink()
+            snapshot = json.dumps(config)
+            if json.loads(snapshot) != config:
+                logging.debug("Config does not survive a JSON round trip; not caching it")
+                return
+            cache_path.write_text(snapshot, encoding='utf-8')
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug(f"Failed to write config cache: {e}")
+    
     def _apply_environment_overrides(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment-specific overrides from the unified config."""
         # Get environment from config or use detected environment
@@ -335,42 +494,13 @@ class ConfigManager:
     def _load_environment_variables(self) -> Dict[str, Any]:
         """Load configuration overrides from environment variables."""
         overrides = {}
+        numbered_tokens = {}
         
-        # GitHub tokens
-        github_tokens = []
-        i = 1
-        while True:
-            token = os.getenv(f"TOKEN_{i}")
-            if not token:
-                # Check for legacy TOKEN variable
-                if i == 1:
-                    legacy_token = os.getenv("TOKEN")
-                    if legacy_token:
-                        github_tokens.append(legacy_token)
-                break
-            github_tokens.append(token)
-            i += 1
-        
-        if github_tokens:
-            overrides.setdefault("github", {})["tokens"] = github_tokens
-        
-        # Other environment variables
-        env_mappings = {
-            "WINGET_REPO_PATH": ("package_processing", "winget_repo_path"),
-            "OUTPUT_DIR": ("package_processing", "output_directory"),
-            "LOG_LEVEL": ("logging", "level"),
-            "LOG_FILE": ("logging", "file"),
-            "MAX_WORKERS": ("package_processing", "max_workers"),
-            "BATCH_SIZE": ("package_processing", "batch_size"),
-            "TIMEOUT": ("package_processing", "timeout"),
-            "CACHE_ENABLED": ("performance", "cache_enabled"),
-            "CACHE_TTL": ("performance", "cache_ttl"),
-            "DEBUG": ("debug",),
-        }
-        
-        for env_var, config_path in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
+        # One pass over the environment picks up both the mapped settings
+        # and the numbered GitHub tokens
+        for env_var, value in os.environ.items():
+            config_path = _ENV_VAR_PATHS.get(env_var)
+            if config_path is not None:
                 # Convert value to appropriate type
                 value = self._convert_env_value(value)
                 
@@ -379,6 +509,27 @@ class ConfigManager:
                 for key in config_path[:-1]:
                     current = current.setdefault(key, {})
                 current[config_path[-1]] = value
+                continue
+            
+            match = _TOKEN_ENV_RE.match(env_var)
+            if match:
+                numbered_tokens[int(match.group(1))] = value
+        
+        # GitHub tokens: TOKEN_1, TOKEN_2, ... up to the first gap or empty value
+        github_tokens = []
+        i = 1
+        while numbered_tokens.get(i):
+            github_tokens.append(numbered_tokens[i])
+            i += 1
+        
+        # Check for legacy TOKEN variable
+        if not github_tokens:
+            legacy_token = os.environ.get("TOKEN")
+            if legacy_token:
+                github_tokens.append(legacy_token)
+        
+        if github_tokens:
+            overrides.setdefault("github", {})["tokens"] = github_tokens
         
         return overrides
     
@@ -426,28 +577,50 @@ class ConfigManager:
         
         return result
     
-    def get(self, key: str, default: Any = None) -> Any:
+    def get(self, key: str, default: Any = None, copy: bool = False) -> Any:
         """Get a configuration value using dot notation.
         
         Args:
             key: Configuration key (e.g., 'github.tokens')
             default: Default value if key is not found
+            copy: Return a full deep copy, including any non-container objects
             
         Returns:
-            Configuration value
+            Configuration value. Sections and lists are returned as plain
+            dict/list copies, so callers cannot change the shared config
+            through them; scalars are returned as-is.
         """
         if not self._loaded:
             self.load_config()
         
-        keys = key.split('.')
-        current = self._config
+        # The lookup cache is private and never handed out, so a repeated
+        # scalar lookup is a single dict hit
+        try:
+            value = self._lookup_cache[key]
+        except KeyError:
+            value = self._resolve(key)
+            self._lookup_cache[key] = value
+        
+        if value is _MISSING:
+            return default
+        if copy:
+            return copy_module.deepcopy(value)
+        if isinstance(value, (dict, list)):
+            return _copy_containers(value)
+        return value
+    
+    def _resolve(self, key: str) -> Any:
+        """Walk the loaded configuration along a dotted key.
         
-        for k in keys:
-            if isinstance(current, dict) and k in current:
+        Returns:
+            The stored value, or _MISSING if any part of the path is absent
+        """
+        current = self._config
+        try:
+            for k in _key_path(key):
                 current = current[k]
-            else:
-                return default
-        
+        except (KeyError, TypeError, IndexError):
+            return _MISSING
         return current
     
     def set(self, key: str, value: Any) -> None:
@@ -460,13 +633,14 @@ class ConfigManager:
         if not self._loaded:
             self.load_config()
         
-        keys = key.split('.')
+        keys = _key_path(key)
         current = self._config
         
         for k in keys[:-1]:
             current = current.setdefault(k, {})
         
         current[keys[-1]] = value
+        self._lookup_cache.clear()
     
     def save_config(self, file_path: Optional[Path] = None, format: str = "yaml") -> None:
         """Save current configuration to file.
@@ -512,6 +686,32 @@ class ConfigManager:
         
         return self.schema.validate(config)
     
+    def reload(self) -> Dict[str, Any]:
+        """Reload configuration, picking up changed files and environment variables.
+        
+        Returns:
+            Complete configuration dictionary
+        """
+        return self.load_config(force_reload=True)
+    
+    def set_environment(self, environment: Optional[str] = None) -> str:
+        """Switch environment without re-reading configuration files now.
+        
+        The configuration is reloaded lazily on next access, from the shared
+        cache when this environment has been loaded before.
+        
+        Args:
+            environment: Environment name, or None to detect it again from
+                ENVIRONMENT/WINGET_ENV
+            
+        Returns:
+            The environment now in effect
+        """
+        self.environment = environment or self._detect_environment()
+        self._loaded = False
+        self._lookup_cache.clear()
+        return self.environment
+    
     def get_environment_info(self) -> Dict[str, Any]:
         """Get information about the current environment.
         
@@ -527,17 +727,27 @@ class ConfigManager:
         }
     
     def _get_available_config_files(self) -> List[str]:
-        """Get list of available configuration files."""
-        if not self.config_path.exists():
-            return []
+        """Get list of available configuration files.
         
-        config_files = []
-        patterns = ["config.*", "*.yaml", "*.yml", "*.json"]
+        The result is computed once and reused until the configuration is
+        reloaded.
+        """
+        if self._config_files_found is not None:
+            return self._config_files_found
         
-        for pattern in patterns:
-            config_files.extend([f.name for f in self.config_path.glob(pattern)])
+        # One scandir pass; DirEntry caches the file type, so no extra stats
+        try:
+            with os.scandir(self.config_path) as entries:
+                config_files = [
+                    entry.name for entry in entries
+                    if entry.is_file() and (entry.name.startswith("config.")
+                                            or entry.name.endswith((".yaml", ".yml", ".json")))
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
         
-        return sorted(list(set(config_files)))
+        self._config_files_found = sorted(config_files)
+        return self._config_files_found
     
     @property
     def config(self) -> Dict[str, Any]:
@@ -557,6 +767,7 @@ class ConfigManager:
         
         # Merge updates into current config
         self._config = self._merge_configs(self._config, updates)
+        self._lookup_cache.clear()
         
         # Save updated configuration
         self.save_config()
@@ -638,19 +849,21 @@ def get_config_manager(config_path: Optional[Union[str, Path]] = None,
     return _config_manager
 
 
-def get_config(key: str = None, default: Any = None) -> Any:
+def get_config(key: str = None, default: Any = None, copy: bool = False) -> Any:
     """Get configuration value(s).
     
     Args:
         key: Configuration key using dot notation (e.g., 'github.tokens')
         default: Default value if key is not found
+        copy: Return a full deep copy; see ConfigManager.get
         
     Returns:
-        Configuration value or complete config if key is None
+        Configuration value or complete config if key is None. Keyed sections
+        and lists are plain dict/list copies; see ConfigManager.get.
     """
     manager = get_config_manager()
     
     if key is None:
         return manager.config
     
-    return manager.get(key, default)
+    return manager.get(key, default, copy=copy)
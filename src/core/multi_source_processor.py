@@ -8,9 +8,9 @@ package sources (GitHub, GitLab, SourceForge, etc.) through a unified interface.
 import logging
 import polars as pl
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 try:
     from ..sources import PackageSourceManager, PackageMetadata, get_package_metadata_for_url
@@ -40,6 +40,81 @@ class ProcessingResult:
     source_type: Optional[PackageSourceType] = None
 
 
+@dataclass
+class MultiSourceBatchResult:
+    """Column-oriented results of a batch run, one entry per package in each list.
+    
+    Consumers that walk thousands of results (e.g. command generation) can
+    iterate the columns they need with zip() instead of following the
+    result -> metadata -> release attribute chain for every package.
+    """
+    package_identifiers: List[str] = field(default_factory=list)
+    successes: List[bool] = field(default_factory=list)
+    source_types: List[Optional[str]] = field(default_factory=list)
+    error_messages: List[Optional[str]] = field(default_factory=list)
+    names: List[Optional[str]] = field(default_factory=list)
+    repository_urls: List[Optional[str]] = field(default_factory=list)
+    versions: List[Optional[str]] = field(default_factory=list)
+    download_urls: List[Optional[Tuple[str, ...]]] = field(default_factory=list)
+    architectures: List[Optional[Tuple[str, ...]]] = field(default_factory=list)
+    file_extensions: List[Optional[Tuple[str, ...]]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.package_identifiers)
+    
+    def add(self, package_identifier: str, success: bool, error_message: Optional[str] = None,
+            metadata: Optional[PackageMetadata] = None) -> None:
+        """Append one package's outcome to every column."""
+        self.package_identifiers.append(package_identifier)
+        self.successes.append(success)
+        self.error_messages.append(error_message)
+        
+        if metadata:
+            latest_release = metadata.latest_release
+            self.source_types.append(metadata.repository_info.source_type.value)
+            self.names.append(metadata.name)
+            self.repository_urls.append(metadata.repository_info.base_url)
+            self.versions.append(latest_release.version if latest_release else None)
+            self.download_urls.append(tuple(metadata.install_urls or ()))
+            self.architectures.append(tuple(metadata.architectures or ()))
+            self.file_extensions.append(tuple(metadata.file_extensions or ()))
+        else:
+            self.source_types.append(None)
+            self.names.append(None)
+            self.repository_urls.append(None)
+            self.versions.append(None)
+            self.download_urls.append(None)
+            self.architectures.append(None)
+            self.file_extensions.append(None)
+    
+    def to_dataframe(self) -> pl.DataFrame:
+        """Build the results DataFrame directly from the columns."""
+        def joined(column: List[Optional[Tuple[str, ...]]]) -> List[Optional[str]]:
+            return [','.join(values) if values is not None else None for values in column]
+        
+        return pl.DataFrame({
+            'PackageIdentifier': self.package_identifiers,
+            'ProcessingSuccess': self.successes,
+            'SourceType': self.source_types,
+            'ErrorMessage': self.error_messages,
+            'PackageName': self.names,
+            'RepositoryURL': self.repository_urls,
+            'LatestVersion': self.versions,
+            'DownloadURLs': joined(self.download_urls),
+            'Architectures': joined(self.architectures),
+            'FileExtensions': joined(self.file_extensions),
+        }, schema_overrides={
+            'SourceType': pl.Utf8,
+            'ErrorMessage': pl.Utf8,
+            'PackageName': pl.Utf8,
+            'RepositoryURL': pl.Utf8,
+            'LatestVersion': pl.Utf8,
+            'DownloadURLs': pl.Utf8,
+            'Architectures': pl.Utf8,
+            'FileExtensions': pl.Utf8,
+        })
+
+
 class MultiSourcePackageProcessor:
     """Package processor that supports multiple package sources."""
     
@@ -80,12 +155,44 @@ class MultiSourcePackageProcessor:
     
     def process_package_urls(self, urls: List[str]) -> List[ProcessingResult]:
         """Process multiple package URLs and return results."""
+        results = []
+        
+        def emit(package_identifier: str, success: bool, error_message: Optional[str] = None,
+                 metadata: Optional[PackageMetadata] = None) -> None:
+            results.append(ProcessingResult(
+                package_identifier=package_identifier,
+                success=success,
+                metadata=metadata,
+                error_message=error_message,
+                source_type=metadata.repository_info.source_type if metadata else None
+            ))
+        
+        self._process_urls(urls, emit)
+        return results
+    
+    def process_package_urls_columnar(self, urls: List[str]) -> MultiSourceBatchResult:
+        """Process multiple package URLs and return column-oriented results.
+        
+        Outcomes are appended straight to the columns, without building a
+        ProcessingResult per package.
+        """
+        batch = MultiSourceBatchResult()
+        self._process_urls(urls, batch.add)
+        return batch
+    
+    def _process_urls(self, urls: List[str], emit: Callable[..., None]) -> None:
+        """Process URLs in parallel, passing each outcome to emit.
+        
+        emit is called from this thread as
+        emit(package_identifier, success, error_message, metadata).
+        """
         if not urls:
-            return []
+            return
         
         self.logger.info(f"Processing {len(urls)} package URLs with {self.max_workers} workers")
         
-        results = []
+        success_count = 0
+        total = 0
         
         # Filter supported URLs
         supported_urls = [url for url in urls if self.source_manager.is_supported_url(url)]
@@ -94,18 +201,15 @@ class MultiSourcePackageProcessor:
         if unsupported_urls:
             self.logger.warning(f"Skipping {len(unsupported_urls)} unsupported URLs")
             for url in unsupported_urls:
-                results.append(ProcessingResult(
-                    package_identifier=url,
-                    success=False,
-                    error_message="Unsupported URL format"
-                ))
+                emit(url, False, "Unsupported URL format")
+            total += len(unsupported_urls)
         
         # Process supported URLs in parallel
         if supported_urls:
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all tasks
                 future_to_url = {
-                    executor.submit(self._process_single_url, url): url 
+                    executor.submit(self._evaluate_url, url): url 
                     for url in supported_urls
                 }
                 
@@ -113,64 +217,43 @@ class MultiSourcePackageProcessor:
                 for future in as_completed(future_to_url):
                     url = future_to_url[future]
                     try:
-                        result = future.result(timeout=self.timeout)
-                        results.append(result)
+                        outcome = future.result(timeout=self.timeout)
                     except Exception as e:
                         self.logger.error(f"Error processing {url}: {e}")
-                        results.append(ProcessingResult(
-                            package_identifier=url,
-                            success=False,
-                            error_message=str(e)
-                        ))
-        
-        success_count = sum(1 for r in results if r.success)
-        self.logger.info(f"Processing complete: {success_count}/{len(results)} successful")
+                        outcome = (url, False, str(e), None)
+                    emit(*outcome)
+                    success_count += outcome[1]
+                    total += 1
         
-        return results
+        self.logger.info(f"Processing complete: {success_count}/{total} successful")
     
-    def _process_single_url(self, url: str) -> ProcessingResult:
-        """Process a single package URL."""
+    def _evaluate_url(self, url: str) -> Tuple[str, bool, Optional[str], Optional[PackageMetadata]]:
+        """Look up and filter a single package URL.
+        
+        Returns:
+            (package_identifier, success, error_message, metadata); metadata
+            is only set for packages that passed
+        """
         try:
             # Get package metadata
             metadata = get_package_metadata_for_url(url)
             
             if not metadata:
-                return ProcessingResult(
-                    package_identifier=url,
-                    success=False,
-                    error_message="Failed to retrieve package metadata"
-                )
+                return url, False, "Failed to retrieve package metadata", None
             
             # Check if package is blocked
             if metadata.identifier in self.blocked_packages:
-                return ProcessingResult(
-                    package_identifier=metadata.identifier,
-                    success=False,
-                    error_message="Package is in blocklist"
-                )
+                return metadata.identifier, False, "Package is in blocklist", None
             
             # Apply filtering
             if not self._passes_filters(metadata):
-                return ProcessingResult(
-                    package_identifier=metadata.identifier,
-                    success=False,
-                    error_message="Package filtered out by criteria"
-                )
+                return metadata.identifier, False, "Package filtered out by criteria", None
             
-            return ProcessingResult(
-                package_identifier=metadata.identifier,
-                success=True,
-                metadata=metadata,
-                source_type=metadata.repository_info.source_type
-            )
+            return metadata.identifier, True, None, metadata
             
         except Exception as e:
             self.logger.error(f"Error processing URL {url}: {e}")
-            return ProcessingResult(
-                package_identifier=url,
-                success=False,
-                error_message=str(e)
-            )
+            return url, False, str(e), None
     
     def _passes_filters(self, metadata: PackageMetadata) -> bool:
         """Check if package metadata passes all filters."""
@@ -217,36 +300,14 @@ class MultiSourcePackageProcessor:
             self.logger.info(f"Processing {len(urls)} unique URLs from {input_path}")
             
             # Process URLs
-            results = self.process_package_urls(urls)
-            
-            # Convert results to DataFrame
-            results_data = []
-            for result in results:
-                row = {
-                    'PackageIdentifier': result.package_identifier,
-                    'ProcessingSuccess': result.success,
-                    'SourceType': result.source_type.value if result.source_type else None,
-                    'ErrorMessage': result.error_message
-                }
-                
-                if result.metadata:
-                    row.update({
-                        'PackageName': result.metadata.name,
-                        'RepositoryURL': result.metadata.repository_info.base_url,
-                        'LatestVersion': result.metadata.latest_release.version if result.metadata.latest_release else None,
-                        'DownloadURLs': ','.join(result.metadata.install_urls or []),
-                        'Architectures': ','.join(result.metadata.architectures or []),
-                        'FileExtensions': ','.join(result.metadata.file_extensions or [])
-                    })
-                
-                results_data.append(row)
+            batch = self.process_package_urls_columnar(urls)
             
             # Save results
-            results_df = pl.DataFrame(results_data)
+            results_df = batch.to_dataframe()
             results_df.write_csv(output_path)
             
-            success_count = sum(1 for r in results if r.success)
-            self.logger.info(f"Results saved to {output_path}: {success_count}/{len(results)} successful")
+            success_count = sum(batch.successes)
+            self.logger.info(f"Results saved to {output_path}: {success_count}/{len(batch)} successful")
             
         except Exception as e:
             raise PackageProcessingError(f"Error processing CSV file: {e}")
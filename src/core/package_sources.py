@@ -17,6 +17,7 @@ from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 import logging
+import re
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -31,6 +32,19 @@ class PackageSourceType(Enum):
     CUSTOM = "custom"
 
 
+# Well-known hosts are dispatched with one match + dict lookup per URL
+_SOURCE_HOST_RE = re.compile(
+    r'https?://(?:[^/]+\.)?(github\.com|gitlab\.com|sourceforge\.net|bitbucket\.org)/',
+    re.IGNORECASE
+)
+_HOST_SOURCE_TYPES = {
+    'github.com': PackageSourceType.GITHUB,
+    'gitlab.com': PackageSourceType.GITLAB,
+    'sourceforge.net': PackageSourceType.SOURCEFORGE,
+    'bitbucket.org': PackageSourceType.BITBUCKET,
+}
+
+
 @dataclass
 class ReleaseInfo:
     """Standard release information across all package sources."""
@@ -230,6 +244,13 @@ class PackageSourceRegistry:
     
     def get_source_for_url(self, url: str) -> Optional[IPackageSource]:
         """Find the appropriate source for a given URL."""
+        match = _SOURCE_HOST_RE.match(url)
+        if match:
+            source = self._sources.get(_HOST_SOURCE_TYPES[match.group(1).lower()])
+            if source is not None and source.can_handle_url(url):
+                return source
+        
+        # Self-hosted instances and custom sources still need a full scan
         for source in self._sources.values():
             if source.can_handle_url(url):
                 return source
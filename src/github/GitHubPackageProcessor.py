@@ -28,10 +28,29 @@ import json
 import yaml
 from urllib.parse import urlparse
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# AllPackageInfo.csv columns read by VersionAnalyzer.process_package, in the
+# positional order it unpacks them
+PACKAGE_INFO_COLUMNS = [
+    "PackageIdentifier",
+    "Source",
+    "AvailableVersions",
+    "VersionFormatPattern",
+    "CurrentLatestVersionInWinGet",
+    "InstallerURLsCount",
+    "LatestVersionURLsInWinGet",
+    "URLPatterns",
+    "LatestVersionPullRequest",
+]
+
 
 @dataclass
 class WinGetManifestExtractor:
@@ -67,7 +86,7 @@ class WinGetManifestExtractor:
         """Extract installer URLs from a single manifest file."""
         try:
             with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest_data = yaml.safe_load(f)
+                manifest_data = yaml.load(f, Loader=_YamlLoader)
                 
             urls = []
             if isinstance(manifest_data, dict):
@@ -497,8 +516,9 @@ class VersionAnalyzer:
         Performance: Processes ~3,400+ GitHub packages out of ~8,300+ total packages
         """
         try:
-            # Read and process package info
-            df = pl.read_csv(input_path)
+            # Scan lazily so the filters below run while the CSV is parsed and
+            # only the GitHub rows and the columns we use are materialized
+            lf = pl.scan_csv(input_path)
 
             # Get blocked packages from config
             config = get_config()
@@ -506,13 +526,15 @@ class VersionAnalyzer:
             
             # Filter out blocked packages
             if blocked_packages:
-                df = df.filter(~pl.col("PackageIdentifier").is_in(blocked_packages))
+                lf = lf.filter(~pl.col("PackageIdentifier").is_in(blocked_packages))
                 logging.info(f"Filtered out {len(blocked_packages)} blocked packages from config")
 
             # Filter for packages with GitHub source (more efficient than URL parsing)
             # Uses the Source column which directly indicates "github.com" for GitHub packages
-            df_filtered = df.filter(
-                pl.col("Source") == "github.com"
+            df_filtered = (
+                lf.filter(pl.col("Source") == "github.com")
+                .select(PACKAGE_INFO_COLUMNS)
+                .collect()
             )
 
             logging.info(
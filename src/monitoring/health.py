@@ -19,12 +19,12 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable, Union
 import threading
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from ..config import get_config, get_config_manager
     from .logging import get_logger
-    from .metrics import get_metrics_collector
+    from .metrics import dump_json, get_metrics_collector
     from ..exceptions import MonitoringError
 except ImportError:
     # Fallback for direct script execution
@@ -32,7 +32,7 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from config import get_config, get_config_manager
     from .logging import get_logger
-    from .metrics import get_metrics_collector
+    from .metrics import dump_json, get_metrics_collector
     from exceptions import MonitoringError
 
 
@@ -180,16 +180,16 @@ class ConfigurationCheck(HealthCheck):
             
             if is_valid:
                 # Additional checks
+                tokens = get_config("github.tokens", [])
                 details = {
                     "environment": config_manager.environment,
                     "config_path": str(config_manager.config_path),
-                    "github_tokens_configured": len(get_config("github.tokens", [])),
+                    "github_tokens_configured": len(tokens),
                     "log_level": get_config("logging.level", "INFO"),
                     "max_workers": get_config("package_processing.max_workers", 4)
                 }
                 
                 # Check for GitHub tokens
-                tokens = get_config("github.tokens", [])
                 if not tokens:
                     return HealthCheckResult(
                         name=self.name,
@@ -229,8 +229,9 @@ class GitHubAPICheck(HealthCheck):
     
     def _check_impl(self) -> HealthCheckResult:
         """Check GitHub API status."""
-        tokens = get_config("github.tokens", [])
-        api_url = get_config("github.api_url", "https://api.github.com")
+        github_config = get_config("github", {})
+        tokens = github_config.get("tokens", [])
+        api_url = github_config.get("api_url", "https://api.github.com")
         
         if not tokens:
             return HealthCheckResult(
@@ -466,28 +467,12 @@ class HealthChecker:
                         check_count=len(checks_to_run),
                         check_names=[check.name for check in checks_to_run])
         
-        for check in checks_to_run:
-            try:
-                result = check.check()
-                results[check.name] = result
-                
-                self.logger.info(f"Health check completed: {check.name}",
-                               check_name=check.name,
-                               status=result.status.value,
-                               duration=result.duration,
-                               check_message=result.message)
-            
-            except Exception as e:
-                self.logger.error(f"Health check error: {check.name}",
-                                error=str(e),
-                                error_type=type(e).__name__)
-                
-                results[check.name] = HealthCheckResult(
-                    name=check.name,
-                    status=HealthStatus.CRITICAL,
-                    message=f"Health check failed: {str(e)}",
-                    details={"error": str(e)}
-                )
+        # Checks are independent and mostly wait on the network or disk, so
+        # they run concurrently; map keeps the registration order
+        if checks_to_run:
+            with ThreadPoolExecutor(max_workers=min(8, len(checks_to_run))) as executor:
+                for check, result in zip(checks_to_run, executor.map(self._run_check, checks_to_run)):
+                    results[check.name] = result
         
         total_duration = time.time() - start_time
         
@@ -505,6 +490,30 @@ class HealthChecker:
         
         return results
     
+    def _run_check(self, check: HealthCheck) -> HealthCheckResult:
+        """Run a single health check, converting unexpected errors to a result."""
+        try:
+            result = check.check()
+            
+            self.logger.info(f"Health check completed: {check.name}",
+                           check_name=check.name,
+                           status=result.status.value,
+                           duration=result.duration,
+                           check_message=result.message)
+            return result
+        
+        except Exception as e:
+            self.logger.error(f"Health check error: {check.name}",
+                            error=str(e),
+                            error_type=type(e).__name__)
+            
+            return HealthCheckResult(
+                name=check.name,
+                status=HealthStatus.CRITICAL,
+                message=f"Health check failed: {str(e)}",
+                details={"error": str(e)}
+            )
+    
     def check_all(self) -> Dict[str, Any]:
         """Perform all health checks and return summary."""
         results = self.check_health()
@@ -545,8 +554,7 @@ class HealthChecker:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        dump_json(report, file_path)
         
         self.logger.info("Health report exported", 
                         file_path=str(file_path),
@@ -148,35 +148,35 @@ class StructuredLogger:
             setup_structured_logging()
             self._setup_done = True
     
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message with structured data."""
         self._ensure_setup()
-        self.logger.debug(message, extra=kwargs)
+        self.logger.debug(message, *args, extra=kwargs)
     
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message with structured data."""
         self._ensure_setup()
-        self.logger.info(message, extra=kwargs)
+        self.logger.info(message, *args, extra=kwargs)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message with structured data."""
         self._ensure_setup()
-        self.logger.warning(message, extra=kwargs)
+        self.logger.warning(message, *args, extra=kwargs)
     
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message with structured data."""
         self._ensure_setup()
-        self.logger.error(message, extra=kwargs)
+        self.logger.error(message, *args, extra=kwargs)
     
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message with structured data."""
         self._ensure_setup()
-        self.logger.critical(message, extra=kwargs)
+        self.logger.critical(message, *args, extra=kwargs)
     
-    def exception(self, message: str, **kwargs):
+    def exception(self, message: str, *args, **kwargs):
         """Log exception with structured data."""
         self._ensure_setup()
-        self.logger.exception(message, extra=kwargs)
+        self.logger.exception(message, *args, extra=kwargs)
     
     def log_operation_start(self, operation: str, **context):
         """Log the start of an operation."""
@@ -413,16 +413,16 @@ def log_operation(operation_name: str = None, logger_name: str = None):
             log_name = logger_name or func.__module__
             logger = get_logger(log_name)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             logger.log_operation_start(op_name, function=func.__name__)
             
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 logger.log_operation_success(op_name, duration=duration)
                 return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 logger.log_operation_failure(op_name, error=e, duration=duration)
                 raise
         
@@ -10,11 +10,12 @@ This module provides comprehensive metrics collection including:
 
 import time
 import threading
+import weakref
 from collections import defaultdict, deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, Iterable, List, Optional, Union, Callable
 import statistics
 import json
 from pathlib import Path
@@ -31,6 +32,27 @@ except ImportError:
     from .logging import get_logger
     from exceptions import MonitoringError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(data: Any, file_path: Path) -> None:
+    """Write ``data`` to ``file_path`` as indented JSON.
+    
+    Uses orjson when it is installed; values JSON cannot represent are
+    written with ``str()`` either way.
+    """
+    if orjson is not None:
+        # Datetimes go through str() as well, matching the json fallback
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=options))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
 
 @dataclass
 class MetricValue:
@@ -85,14 +107,18 @@ class Timer:
         self.start_time = None
         self.end_time = None
         self.duration = None
+        self._start_counter = None
     
     def __enter__(self) -> 'Timer':
         self.start_time = datetime.utcnow()
+        self._start_counter = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # Durations come from the monotonic perf counter; the wall-clock
+        # timestamps are kept for reporting only
+        self.duration = time.perf_counter() - self._start_counter
         self.end_time = datetime.utcnow()
-        self.duration = (self.end_time - self.start_time).total_seconds()
         
         # Add error tag if exception occurred
         if exc_type is not None:
@@ -113,38 +139,87 @@ class Timer:
         )
 
 
+class _CellHolder:
+    """Thread-local owner of a counter cell; dropped when its thread exits."""
+    
+    __slots__ = ("cell", "__weakref__")
+    
+    def __init__(self, cell: List[int]):
+        self.cell = cell
+
+
 class Counter:
-    """Thread-safe counter for metrics."""
+    """Thread-safe counter for metrics.
+    
+    Each thread adds into its own cell, so increments never contend on a
+    lock; the cells are summed whenever the value is read. A thread's cell
+    is folded into the total and dropped once the thread exits.
+    """
     
     def __init__(self, name: str):
         self.name = name
-        self._value = 0
+        self._offset = 0
+        self._cells: Dict[int, List[int]] = {}
+        self._local = threading.local()
         self._lock = threading.Lock()
     
-    def increment(self, delta: int = 1) -> int:
-        """Increment counter by delta."""
+    def _cell(self) -> List[int]:
+        """Return the calling thread's cell, registering it on first use."""
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            cell = [0]
+            holder = self._local.holder = _CellHolder(cell)
+            with self._lock:
+                self._cells[id(cell)] = cell
+            # threading.local releases the holder when the thread exits
+            weakref.finalize(holder, _retire_cell, weakref.ref(self), cell)
+        return holder.cell
+    
+    def _retire(self, cell: List[int]) -> None:
+        """Fold an exited thread's cell into the total."""
         with self._lock:
-            self._value += delta
-            return self._value
+            if self._cells.pop(id(cell), None) is not None:
+                self._offset += cell[0]
+    
+    def increment(self, delta: int = 1) -> int:
+        """Increment counter by delta.
+        
+        Returns:
+            The total after the increment. It is summed without taking the
+            lock, so concurrent increments from other threads may or may
+            not be included yet.
+        """
+        # Only the owning thread writes a cell, so no lock is needed here
+        self._cell()[0] += delta
+        return self._offset + sum(cell[0] for cell in list(self._cells.values()))
     
     def decrement(self, delta: int = 1) -> int:
         """Decrement counter by delta."""
-        with self._lock:
-            self._value -= delta
-            return self._value
+        return self.increment(-delta)
     
     def reset(self) -> int:
         """Reset counter to zero."""
+        # Offsetting instead of zeroing the cells keeps concurrent
+        # increments from being lost
         with self._lock:
-            old_value = self._value
-            self._value = 0
+            old_value = self._total()
+            self._offset -= old_value
             return old_value
     
+    def _total(self) -> int:
+        return self._offset + sum(cell[0] for cell in self._cells.values())
+    
     @property
     def value(self) -> int:
         """Get current counter value."""
         with self._lock:
-            return self._value
+            return self._total()
+
+
+def _retire_cell(counter_ref: "weakref.ref[Counter]", cell: List[int]) -> None:
+    counter = counter_ref()
+    if counter is not None:
+        counter._retire(cell)
 
 
 class Gauge:
@@ -193,6 +268,12 @@ class Histogram:
         with self._lock:
             self._samples.append(float(value))
     
+    def observe_many(self, values: Iterable[Union[int, float]]) -> None:
+        """Observe several values under a single lock acquisition."""
+        samples = [float(value) for value in values]
+        with self._lock:
+            self._samples.extend(samples)
+    
     def get_statistics(self) -> Dict[str, float]:
         """Get histogram statistics."""
         with self._lock:
@@ -207,19 +288,25 @@ class Histogram:
                     "p99": 0.0
                 }
             
-            samples = list(self._samples)
-            sorted_samples = sorted(samples)
-            count = len(samples)
-            
-            return {
-                "count": count,
-                "min": min(samples),
-                "max": max(samples),
-                "mean": statistics.mean(samples),
-                "median": statistics.median(samples),
-                "p95": sorted_samples[int(count * 0.95)] if count > 0 else 0.0,
-                "p99": sorted_samples[int(count * 0.99)] if count > 0 else 0.0
-            }
+            sorted_samples = sorted(self._samples)
+        
+        # Every statistic is read off the one sorted copy, outside the lock
+        count = len(sorted_samples)
+        mid = count // 2
+        if count % 2:
+            median = sorted_samples[mid]
+        else:
+            median = (sorted_samples[mid - 1] + sorted_samples[mid]) / 2
+        
+        return {
+            "count": count,
+            "min": sorted_samples[0],
+            "max": sorted_samples[-1],
+            "mean": statistics.fmean(sorted_samples),
+            "median": median,
+            "p95": sorted_samples[int(count * 0.95)],
+            "p99": sorted_samples[int(count * 0.99)]
+        }
 
 
 class MetricsCollector:
@@ -272,6 +359,10 @@ class MetricsCollector:
     
     def get_counter(self, name: str) -> Counter:
         """Get or create a counter."""
+        # Existing counters are found without taking the collector lock
+        counter = self._counters.get(name)
+        if counter is not None:
+            return counter
         with self._lock:
             if name not in self._counters:
                 self._counters[name] = Counter(name)
@@ -363,6 +454,17 @@ class MetricsCollector:
         if tags:
             self.record_metric(name, value, tags)
     
+    def observe_histogram_batch(self, name: str, values: Iterable[Union[int, float]],
+                                tags: Dict[str, str] = None) -> None:
+        """Observe several values in a histogram at once."""
+        values = list(values)
+        histogram = self.get_histogram(name)
+        histogram.observe_many(values)
+        
+        if tags:
+            for value in values:
+                self.record_metric(name, value, tags)
+    
     def record_api_call(self, method: str, endpoint: str, status_code: int,
                        duration: float, success: bool = None) -> None:
         """Record an API call metric."""
@@ -470,8 +572,7 @@ class MetricsCollector:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         if format.lower() == "json":
-            with open(file_path, 'w') as f:
-                json.dump(metrics, f, indent=2, default=str)
+            dump_json(metrics, file_path)
         else:
             raise ValueError(f"Unsupported export format: {format}")
         
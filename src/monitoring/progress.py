@@ -8,16 +8,15 @@ import time
 import threading
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable, Union
+from typing import Dict, List, Optional, Any, Callable, Sequence, Union
 from enum import Enum
-import json
 import sys
 from pathlib import Path
 
 try:
     from ..config import get_config
     from .logging import get_logger
-    from .metrics import get_metrics_collector
+    from .metrics import dump_json, get_metrics_collector
     from ..exceptions import MonitoringError
 except ImportError:
     # Fallback for direct script execution
@@ -25,7 +24,7 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from config import get_config
     from .logging import get_logger
-    from .metrics import get_metrics_collector
+    from .metrics import dump_json, get_metrics_collector
     from exceptions import MonitoringError
 
 
@@ -137,7 +136,7 @@ class ProgressBar:
 class ProgressTracker:
     """Multi-step progress tracker with real-time updates."""
     
-    def __init__(self, name: str, steps: List[str] = None):
+    def __init__(self, name: str, steps: Sequence[str] = None):
         self.name = name
         self.steps: Dict[str, ProgressStep] = {}
         self.current_step: Optional[str] = None
@@ -431,8 +430,7 @@ class ProgressTracker:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w') as f:
-            json.dump(progress_data, f, indent=2, default=str)
+        dump_json(progress_data, file_path)
         
         self.logger.info("Progress data exported",
                         tracker=self.name,
@@ -447,7 +445,7 @@ class ProgressManager:
         self.logger = get_logger(__name__)
         self._lock = threading.Lock()
     
-    def create_tracker(self, name: str, steps: List[str] = None) -> ProgressTracker:
+    def create_tracker(self, name: str, steps: Sequence[str] = None) -> ProgressTracker:
         """Create a new progress tracker."""
         with self._lock:
             if name in self.trackers:
@@ -509,7 +507,7 @@ class ProgressManager:
 _progress_manager: Optional[ProgressManager] = None
 
 
-def get_progress_tracker(name: str, steps: List[str] = None, 
+def get_progress_tracker(name: str, steps: Sequence[str] = None, 
                         create_if_not_exists: bool = True) -> Optional[ProgressTracker]:
     """Get or create a progress tracker."""
     global _progress_manager
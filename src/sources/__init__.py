@@ -5,32 +5,29 @@ Each source (github, gitlab, sourceforge) is implemented as a single file
 containing all necessary functionality for that source type.
 """
 
-# Import source modules
-try:
-    from . import github
-except ImportError:
-    github = None
+import importlib
 
-try:
-    from . import gitlab  
-except ImportError:
-    gitlab = None
+# Source modules are imported on first access, so importing the package
+# does not pay for every source implementation and its dependencies
+_SOURCE_MODULES = ('github', 'gitlab', 'sourceforge')
 
-try:
-    from . import sourceforge
-except ImportError:
-    sourceforge = None
+
+def __getattr__(name: str):
+    """Import a source module the first time it is accessed."""
+    if name not in _SOURCE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        module = importlib.import_module(f".{name}", __name__)
+    except ImportError:
+        module = None
+    globals()[name] = module
+    return module
 
 
 def get_source_module(source_type: str):
     """Get a source module by type."""
-    sources = {
-        'github': github,
-        'gitlab': gitlab,
-        'sourceforge': sourceforge,
-    }
-    
-    module = sources.get(source_type)
+    module = __getattr__(source_type) if source_type in _SOURCE_MODULES else None
     if module is None:
         raise ValueError(f"Unknown source type: {source_type}")
     return module
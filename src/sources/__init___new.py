@@ -11,7 +11,8 @@ from .base import (
 )
 from .registry import (
     SourceRegistry, SourceFactory, get_registry, get_factory,
-    register_source, create_source, auto_detect_and_process
+    register_source, create_source, auto_detect_and_process,
+    auto_detect_and_process_many
 )
 from .github import GitHubSource
 from .gitlab import GitLabSource
@@ -35,6 +36,7 @@ __all__ = [
     # Registry and factory
     'SourceRegistry', 'SourceFactory', 'get_registry', 'get_factory',
     'register_source', 'create_source', 'auto_detect_and_process',
+    'auto_detect_and_process_many',
     
     # Source implementations
     'GitHubSource', 'GitLabSource', 'SourceForgeSource',
@@ -0,0 +1,117 @@
+"""
+Stale-while-revalidate cache for package source API responses.
+
+Entries younger than ``ttl_fresh`` are served directly. Entries older than
+that but younger than ``ttl_stale`` are served immediately while a background
+refresh fetches a new value. Failed or empty fetches never overwrite a cached
+value, so a stale entry keeps being served while the upstream API is failing.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "wmat"
+
+
+class SWRCache:
+    """Persistent (sqlite) stale-while-revalidate cache for JSON values."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_DIR / "swr_cache.sqlite",
+                 ttl_fresh: float = 300, ttl_stale: float = 900, max_workers: int = 2):
+        self.path = Path(path).expanduser()
+        self.ttl_fresh = ttl_fresh
+        self.ttl_stale = ttl_stale
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS swr_cache "
+                "(key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per operation keeps the cache safe to share between threads
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT fetched_at, value FROM swr_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"SWR cache read failed for {key}: {e}")
+            return None
+
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _write(self, key: str, value: Any) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO swr_cache (key, fetched_at, value) VALUES (?, ?, ?)",
+                    (key, time.time(), json.dumps(value)),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug(f"SWR cache write failed for {key}: {e}")
+
+    def get(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return the value for ``key``, calling ``fetch`` only when needed."""
+        cached = self._read(key)
+        if cached is not None:
+            fetched_at, value = cached
+            age = time.time() - fetched_at
+            if age < self.ttl_fresh:
+                return value
+            if age < self.ttl_stale:
+                self._schedule_refresh(key, fetch)
+                return value
+
+        try:
+            value = fetch()
+        except Exception:
+            if cached is not None:
+                logger.warning(f"Fetch failed for {key}, serving stale cache entry")
+                return cached[1]
+            raise
+
+        if value is None:
+            return cached[1] if cached is not None else None
+
+        self._write(key, value)
+        return value
+
+    def _schedule_refresh(self, key: str, fetch: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="swr-refresh")
+        self._executor.submit(self._refresh, key, fetch)
+
+    def _refresh(self, key: str, fetch: Callable[[], Any]) -> None:
+        try:
+            value = fetch()
+            if value is not None:
+                self._write(key, value)
+        except Exception as e:
+            logger.debug(f"Background refresh failed for {key}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -7,6 +7,7 @@ migrated from the legacy GitHub-specific modules.
 
 import re
 import logging
+from functools import partial
 from typing import Any, Dict, List, Optional, Set
 from urllib.parse import urlparse
 
@@ -14,6 +15,7 @@ try:
     from ..base import BasePackageSource, SourceType, ReleaseInfo, RepositoryInfo, PackageMetadata
     from ..base.url_matcher import BaseURLMatcher
     from ..base.filter_base import BasePackageFilter
+    from .._swr_cache import SWRCache, DEFAULT_CACHE_DIR
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -25,6 +27,7 @@ except ImportError:
     from base import BasePackageSource, SourceType, ReleaseInfo, RepositoryInfo, PackageMetadata
     from base.url_matcher import BaseURLMatcher
     from base.filter_base import BasePackageFilter
+    from _swr_cache import SWRCache, DEFAULT_CACHE_DIR
 
 # Import existing GitHub utilities
 try:
@@ -36,16 +39,19 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; URL matching runs for every package URL in a batch
+_GITHUB_URL_PATTERNS = (
+    re.compile(r'github\.com/([^/]+)/([^/]+)', re.IGNORECASE),
+    re.compile(r'api\.github\.com/repos/([^/]+)/([^/]+)', re.IGNORECASE),
+)
+
 
 class GitHubURLMatcher(BaseURLMatcher):
     """GitHub-specific URL matcher."""
     
     def __init__(self):
         super().__init__()
-        self.github_patterns = [
-            r'github\.com/([^/]+)/([^/]+)',
-            r'api\.github\.com/repos/([^/]+)/([^/]+)',
-        ]
+        self.github_patterns = _GITHUB_URL_PATTERNS
     
     def is_github_url(self, url: str) -> bool:
         """Check if URL is a GitHub URL."""
@@ -53,7 +59,7 @@ class GitHubURLMatcher(BaseURLMatcher):
             return False
         
         for pattern in self.github_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
+            if pattern.search(url):
                 return True
         
         return False
@@ -61,7 +67,7 @@ class GitHubURLMatcher(BaseURLMatcher):
     def extract_repo_info(self, url: str) -> Optional[tuple]:
         """Extract owner and repo name from GitHub URL."""
         for pattern in self.github_patterns:
-            match = re.search(pattern, url, re.IGNORECASE)
+            match = pattern.search(url)
             if match:
                 return match.group(1), match.group(2)
         
@@ -116,13 +122,31 @@ class GitHubSource(BasePackageSource):
         # Initialize GitHub API if tokens are available
         self.github_api = None
         self.token_manager = None
+        self.api_base_url = "https://api.github.com"
         
         try:
             if 'github_tokens' in config:
                 self.token_manager = TokenManager(config['github_tokens'])
                 self.github_api = GitHubAPI(self.token_manager)
+                api_config = getattr(self.github_api, 'config', None)
+                self.api_base_url = getattr(api_config, 'base_url', self.api_base_url)
         except Exception as e:
             self.logger.warning(f"Failed to initialize GitHub API: {e}")
+        
+        # Latest-release lookups can be served stale-while-revalidate. Off by
+        # default: a stale hit returns a release older than what GitHub has
+        # now, and a one-shot run never sees its own background refresh
+        self.release_cache = None
+        cache_config = config.get('release_cache', {})
+        if self.github_api and cache_config.get('enabled', False):
+            try:
+                self.release_cache = SWRCache(
+                    cache_config.get('path', DEFAULT_CACHE_DIR / "github_releases.sqlite"),
+                    ttl_fresh=cache_config.get('ttl_fresh', 300),
+                    ttl_stale=cache_config.get('ttl_stale', 900),
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to initialize release cache: {e}")
     
     @property
     def source_type(self) -> SourceType:
@@ -208,8 +232,15 @@ class GitHubSource(BasePackageSource):
                 else:
                     return None
             
-            # Get latest release from API
-            release_data = self.github_api.get_latest_release(owner, repo)
+            # Get latest release from API (or the release cache)
+            fetch = partial(self.github_api.get_latest_release, owner, repo)
+            if self.release_cache:
+                # Keyed by API host too, so GitHub Enterprise repos do not
+                # collide with github.com repos of the same name
+                cache_key = f"github:latest:{self.api_base_url}/{owner}/{repo}"
+                release_data = self.release_cache.get(cache_key, fetch)
+            else:
+                release_data = fetch()
             if not release_data:
                 return None
             
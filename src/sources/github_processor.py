@@ -17,6 +17,11 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 import pandas as pd
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Import core dependencies
 try:
     from ..utils.token_manager import TokenManager
@@ -73,7 +78,7 @@ class WinGetManifestExtractor:
         """Extract installer URLs from a single manifest file."""
         try:
             with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest_data = yaml.safe_load(f)
+                manifest_data = yaml.load(f, Loader=_YamlLoader)
                 
             urls = []
             if isinstance(manifest_data, dict):
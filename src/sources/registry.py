@@ -5,12 +5,22 @@ This module provides a registry and factory for managing different package sourc
 enabling dynamic source creation and management.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Type, Optional, Any
 from .base import BasePackageSource, SourceType, PackageMetadata
+from ..core.package_sources import _SOURCE_HOST_RE, _HOST_SOURCE_TYPES as _HOST_PACKAGE_SOURCE_TYPES
 import logging
 
 logger = logging.getLogger(__name__)
 
+# The host table is defined once in core.package_sources; map its entries
+# onto this module's SourceType by value
+_HOST_SOURCE_TYPES = {
+    host: SourceType(source_type.value)
+    for host, source_type in _HOST_PACKAGE_SOURCE_TYPES.items()
+}
+
 
 class SourceRegistry:
     """Registry for package source implementations."""
@@ -102,6 +112,15 @@ class SourceFactory:
     
     def detect_source_from_url(self, url: str) -> Optional[SourceType]:
         """Detect the appropriate source type from a URL."""
+        match = _SOURCE_HOST_RE.match(url)
+        if match:
+            source_type = _HOST_SOURCE_TYPES[match.group(1).lower()]
+            if self.registry.is_source_available(source_type):
+                source = self.registry.get_source_instance(source_type)
+                if source and source.is_supported_url(url):
+                    return source_type
+        
+        # Self-hosted instances and custom sources still need a full scan
         for source_type in self.registry.get_available_sources():
             source = self.registry.get_source_instance(source_type)
             if source and source.is_supported_url(url):
@@ -123,6 +142,50 @@ class SourceFactory:
             return None
         
         return source.extract_package_info(url)
+    
+    def process_urls_with_appropriate_sources(self, urls: List[str], configs: Dict[SourceType, Dict[str, Any]] = None,
+                                              max_workers: int = 4) -> Dict[str, Optional[PackageMetadata]]:
+        """Process many URLs, grouped by source type and fetched concurrently.
+        
+        Returns a mapping of each URL, in input order, to its metadata (None
+        when no source handles the URL or the lookup failed).
+        """
+        results: Dict[str, Optional[PackageMetadata]] = {}
+        buckets: Dict[SourceType, List[str]] = {}
+        for url in set(urls):
+            source_type = self.detect_source_from_url(url)
+            if not source_type:
+                self.logger.warning(f"No source found for URL: {url}")
+                results[url] = None
+                continue
+            buckets.setdefault(source_type, []).append(url)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submit every bucket before collecting so all sources run at once
+            pending = []
+            for source_type, bucket in buckets.items():
+                config = configs.get(source_type, {}) if configs else {}
+                source = self.registry.get_source_instance(source_type, config)
+                if not source:
+                    self.logger.error(f"Failed to create source {source_type.value} for {len(bucket)} URLs")
+                    results.update(dict.fromkeys(bucket))
+                    continue
+                pending.append((bucket, executor.map(
+                    lambda url, source=source: self._extract_or_none(source, url), bucket
+                )))
+            
+            for bucket, metadata in pending:
+                results.update(zip(bucket, metadata))
+        
+        return {url: results[url] for url in dict.fromkeys(urls)}
+    
+    def _extract_or_none(self, source: BasePackageSource, url: str) -> Optional[PackageMetadata]:
+        """Extract package info for one URL of a batch, mapping errors to None."""
+        try:
+            return source.extract_package_info(url)
+        except Exception as e:
+            self.logger.error(f"Failed to process URL {url}: {e}")
+            return None
 
 
 # Global registry instance
@@ -150,7 +213,70 @@ def create_source(source_type: SourceType, config: Dict[str, Any] = None) -> Opt
     return factory.create_source(source_type, config)
 
 
-def auto_detect_and_process(url: str, configs: Dict[SourceType, Dict[str, Any]] = None) -> Optional[PackageMetadata]:
-    """Auto-detect source and process URL."""
+# Metadata for URLs processed with the default source configs, kept for the
+# lifetime of the process. Failed lookups (None) are not stored, so a
+# transient API error is retried on the next call.
+_PROCESSED_URLS: Dict[str, PackageMetadata] = {}
+_PROCESSED_URLS_MAX = 4096
+_processed_urls_lock = threading.Lock()
+
+
+def _remember_processed(url: str, metadata: Optional[PackageMetadata]) -> None:
+    if metadata is None:
+        return
+    with _processed_urls_lock:
+        _PROCESSED_URLS.pop(url, None)
+        if len(_PROCESSED_URLS) >= _PROCESSED_URLS_MAX:
+            # Evict the oldest entry
+            del _PROCESSED_URLS[next(iter(_PROCESSED_URLS))]
+        _PROCESSED_URLS[url] = metadata
+
+
+def auto_detect_and_process(url: str, configs: Dict[SourceType, Dict[str, Any]] = None,
+                            refresh: bool = False) -> Optional[PackageMetadata]:
+    """Auto-detect source and process URL.
+    
+    Successful lookups without explicit configs are cached by URL for the
+    lifetime of the process; pass refresh=True to fetch again and replace
+    the cached entry.
+    """
+    factory = get_factory()
+    if configs is not None:
+        return factory.process_url_with_appropriate_source(url, configs)
+    
+    if not refresh:
+        metadata = _PROCESSED_URLS.get(url)
+        if metadata is not None:
+            return metadata
+    
+    metadata = factory.process_url_with_appropriate_source(url)
+    _remember_processed(url, metadata)
+    return metadata
+
+
+def auto_detect_and_process_many(urls: List[str], configs: Dict[SourceType, Dict[str, Any]] = None,
+                                 max_workers: int = 4, refresh: bool = False) -> Dict[str, Optional[PackageMetadata]]:
+    """Auto-detect sources and process many URLs concurrently.
+    
+    Shares auto_detect_and_process's cache when no configs are given, so
+    only URLs not already looked up are fetched.
+    """
     factory = get_factory()
-    return factory.process_url_with_appropriate_source(url, configs)
+    if configs is not None:
+        return factory.process_urls_with_appropriate_sources(urls, configs, max_workers)
+    
+    results: Dict[str, Optional[PackageMetadata]] = {}
+    if not refresh:
+        for url in urls:
+            metadata = _PROCESSED_URLS.get(url)
+            if metadata is not None:
+                results[url] = metadata
+    
+    missing = [url for url in dict.fromkeys(urls) if url not in results]
+    if missing:
+        fetched = factory.process_urls_with_appropriate_sources(missing, None, max_workers)
+        for url, metadata in fetched.items():
+            _remember_processed(url, metadata)
+        results.update(fetched)
+    
+    return {url: results[url] for url in dict.fromkeys(urls)}
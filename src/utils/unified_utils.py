@@ -20,6 +20,12 @@ except ImportError:
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# libyaml's C implementations are several times faster when PyYAML has them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
@@ -59,7 +65,7 @@ class YAMLProcessorBase:
     def process_yaml_file(self, yaml_path: Path) -> Optional[Dict]:
         try:
             with open(yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
                 return data
         except Exception as e:
             logging.error(f"Error processing YAML file {yaml_path}: {e}")
@@ -94,11 +100,12 @@ class YAMLProcessorBase:
     ) -> None:
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = [executor.submit(process_func, item) for item in items]
-            concurrent.futures.wait(futures)
 
-            for future in futures:
-                if future.exception():
-                    logging.error(f"Error in thread: {future.exception()}")
+            # Report failures as tasks finish instead of after the slowest one
+            for future in concurrent.futures.as_completed(futures):
+                error = future.exception()
+                if error:
+                    logging.error(f"Error in thread: {error}")
 
 
 class GitHubAPIBase:
@@ -288,7 +295,7 @@ class ManifestProcessor:
         """Load and parse a YAML manifest file."""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YamlLoader)
         except Exception as e:
             logging.error(f"Error loading manifest {file_path}: {e}")
             return None
@@ -298,7 +305,7 @@ class ManifestProcessor:
         """Save manifest data to a YAML file."""
         try:
             with open(file_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(data, f, allow_unicode=True)
+                yaml.dump(data, f, Dumper=_YamlDumper, allow_unicode=True)
             return True
         except Exception as e:
             logging.error(f"Error saving manifest {file_path}: {e}")